@@ -40,9 +40,15 @@ from __future__ import annotations
 
 import os
 import re
+import asyncio
 import logging
+import threading
+import weakref
+from functools import cached_property, lru_cache
 from datetime import datetime, date, time
 from decimal import Decimal
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 import json
@@ -52,6 +58,29 @@ try:
 except ImportError:
     msgpack = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
 try:
     import httpx
 except ImportError:
@@ -72,6 +101,10 @@ __all__ = [
     'XAPIAND_PORT',
     'XAPIAND_COMMIT',
     'XAPIAND_PREFIX',
+    'XAPIAND_MAX_CONNECTIONS',
+    'XAPIAND_KEEPALIVE_EXPIRY',
+    'XAPIAND_HTTP2',
+    'DEFAULT_ACCEPT_ENCODING',
     '_serialize_default',
     '_deserialize_value',
 ]
@@ -79,16 +112,49 @@ __all__ = [
 logger = logging.getLogger('xapiand')
 
 OFFSET_LIMIT = 100000  # LIMIT TO AVOID SLOWDOWN XAPIAND WITH HIGH OFFSET
+# httpx decodes zstd and brotli responses natively when their packages are installed.
+DEFAULT_ACCEPT_ENCODING = 'deflate, gzip, identity'
+if brotli is not None:
+    DEFAULT_ACCEPT_ENCODING = f'br, {DEFAULT_ACCEPT_ENCODING}'
+if zstandard is not None:
+    DEFAULT_ACCEPT_ENCODING = f'zstd, {DEFAULT_ACCEPT_ENCODING}'
+
+MAX_PATH_LENGTH = 4096  # LONGER STRING BODIES ARE NEVER TREATED AS FILE PATHS
+UPLOAD_CHUNK_SIZE = 64 * 1024  # FILE BODIES ARE STREAMED IN CHUNKS OF THIS SIZE
 
 RESPONSE_QUERY = '#query'
 RESPONSE_AGGREGATIONS = '#aggregations'
 RESPONSE_TOOK = '#took'
 COMMAND_PREFIX = ':'
 
+# Payload kinds returned by _content_kind.
+_CT_OTHER = 0
+_CT_JSON = 1
+_CT_MSGPACK = 2
+
+_MSGPACK_CONTENT_TYPE = 'application/x-msgpack'
+_JSON_CONTENT_TYPE = 'application/json'
+
+# Search response keys renamed in the results returned to callers.
+_SEARCH_RESULT_KEYS = (
+    ('#hits', 'hits'),
+    ('#total_count', 'count'),
+    ('#matches_estimated', 'total'),
+)
+
+# Actions whose 404 responses mean "no such document" (NotFoundError or default).
+_NOT_FOUND_ACTIONS = frozenset(('patch', 'merge', 'delete', 'get'))
+
+# Flag params that are only sent when set.
+_OPTIONAL_FLAG_PARAMS = frozenset(('commit', 'volatile', 'pretty', 'indent'))
+
 XAPIAND_HOST = os.environ.get('XAPIAND_HOST', '127.0.0.1')
-XAPIAND_PORT = os.environ.get('XAPIAND_PORT', 8880)
-XAPIAND_COMMIT = os.environ.get('XAPIAND_COMMIT', False)
+XAPIAND_PORT = int(os.environ.get('XAPIAND_PORT', 8880))
+XAPIAND_COMMIT = os.environ.get('XAPIAND_COMMIT', '').lower() in ('1', 'true', 'yes', 'on')
+XAPIAND_HTTP2 = os.environ.get('XAPIAND_HTTP2', '').lower() in ('1', 'true', 'yes', 'on')
 XAPIAND_PREFIX = os.environ.get('XAPIAND_PREFIX', 'default')
+XAPIAND_MAX_CONNECTIONS = int(os.environ.get('XAPIAND_MAX_CONNECTIONS', 1000))
+XAPIAND_KEEPALIVE_EXPIRY = float(os.environ.get('XAPIAND_KEEPALIVE_EXPIRY', 60.0))
 
 
 type IndexSpec = str | tuple[str, ...] | list[str] | set[str]
@@ -104,9 +170,17 @@ TransportError = httpx.HTTPStatusError
 NA = object()
 
 
-_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}(?::?\d{2})?|Z)?$')
-_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-_TIME_RE = re.compile(r'^\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}(?::?\d{2})?|Z)?$')
+# ISO 8601 date, datetime, or time, matched in a single pass. The name of the
+# last group that matched (``m.lastgroup``) selects the parser.
+_ISO_RE = re.compile(
+    r'(?P<date>\d{4}-\d{2}-\d{2})(?P<datetime>[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}(?::?\d{2})?|Z)?)?'
+    r'|(?P<time>\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}(?::?\d{2})?|Z)?)'
+)
+_ISO_PARSERS = {
+    'date': date.fromisoformat,
+    'datetime': datetime.fromisoformat,
+    'time': time.fromisoformat,
+}
 
 
 def _deserialize_value(value: Any) -> Any:
@@ -124,12 +198,9 @@ def _deserialize_value(value: Any) -> Any:
     if isinstance(value, float):
         return Decimal(str(value))
     if isinstance(value, str):
-        if _DATETIME_RE.fullmatch(value):
-            return datetime.fromisoformat(value)
-        if _DATE_RE.fullmatch(value):
-            return date.fromisoformat(value)
-        if _TIME_RE.fullmatch(value):
-            return time.fromisoformat(value)
+        match = _ISO_RE.fullmatch(value)
+        if match is not None:
+            return _ISO_PARSERS[match.lastgroup](value)
     if isinstance(value, list):
         return [_deserialize_value(v) for v in value]
     return value
@@ -151,8 +222,240 @@ def _deserialize_object_pairs_hook(pairs: list[tuple[str, Any]]) -> DictObject:
     return DictObject((k, _deserialize_value(v)) for k, v in pairs)
 
 
+def _json_dumps(obj: Any) -> bytes | str:
+    """Serialize a request body to JSON.
+
+    Uses ``orjson`` when it is installed, which encodes straight to UTF-8
+    ``bytes`` in C, and falls back to the standard library ``json``
+    module otherwise. Both paths route ``Decimal`` and
+    ``datetime``/``date``/``time`` values through ``_serialize_default``.
+    Bodies orjson cannot encode, such as integers wider than 64 bits, are
+    encoded with the standard library instead. The two encoders still
+    differ in that orjson writes ``NaN`` and infinities as ``null`` (the
+    standard library writes ``NaN``/``Infinity``, which are not valid
+    JSON), and serializes ``UUID`` and dataclass instances natively where
+    the standard library raises ``TypeError``.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        bytes | str: The JSON document (``bytes`` from orjson, ASCII-only
+            ``str`` from the standard library).
+
+    Raises:
+        TypeError: If the object contains an unsupported type.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=_serialize_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, ensure_ascii=True, default=_serialize_default)
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode a JSON response body.
+
+    Floats are parsed as ``Decimal`` and objects become ``DictObject``
+    instances with ISO 8601 strings revived.
+
+    Args:
+        content: The raw response body.
+
+    Returns:
+        The decoded document.
+    """
+    return json.loads(content, object_pairs_hook=_deserialize_object_pairs_hook, parse_float=Decimal)
+
+
+def _msgpack_loads(content: bytes) -> Any:
+    """Decode a msgpack response body.
+
+    Maps become ``DictObject`` instances with ISO 8601 strings revived.
+
+    Args:
+        content: The raw response body.
+
+    Returns:
+        The decoded document.
+    """
+    return msgpack.loads(content, object_pairs_hook=_deserialize_object_pairs_hook)
+
+
+# Response body decoders by payload kind.
+_DECODERS = {
+    _CT_JSON: _json_loads,
+    _CT_MSGPACK: _msgpack_loads,
+}
+
+
+def _is_file_path(body: Any) -> bool:
+    """Tell whether a request body refers to a file to upload.
+
+    ``os.PathLike`` bodies are always treated as files. Plain strings are
+    only checked against the filesystem when they are short enough to be
+    a path, so large string payloads never cost a ``stat()`` call.
+
+    Args:
+        body: The request body.
+
+    Returns:
+        bool: ``True`` if the body should be opened and sent as a file.
+    """
+    if isinstance(body, os.PathLike):
+        return True
+    return isinstance(body, str) and len(body) < MAX_PATH_LENGTH and os.path.isfile(body)
+
+
+async def _iter_file(path: str | os.PathLike) -> AsyncIterator[bytes]:
+    """Stream a file in binary chunks without blocking the event loop.
+
+    Opening, reading, and closing the file run in a worker thread, so
+    large uploads neither stall other requests on the loop nor have to
+    fit in memory.
+
+    Args:
+        path: Path of the file to upload.
+
+    Yields:
+        bytes: Consecutive chunks of at most ``UPLOAD_CHUNK_SIZE`` bytes.
+    """
+    f = await asyncio.to_thread(open, path, 'rb')
+    try:
+        while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+            yield chunk
+    finally:
+        f.close()
+
+
+@lru_cache(maxsize=64)
+def _content_kind(content_type: str) -> int:
+    """Classify a ``Content-Type`` value by serialization format.
+
+    Servers answer with a handful of distinct content types, so results
+    are memoized.
+
+    Args:
+        content_type: A ``Content-Type`` header value, possibly with
+            parameters (e.g. ``'application/json; charset=utf-8'``).
+
+    Returns:
+        int: ``_CT_MSGPACK``, ``_CT_JSON``, or ``_CT_OTHER``.
+    """
+    if content_type.startswith(_MSGPACK_CONTENT_TYPE):
+        return _CT_MSGPACK
+    if content_type.startswith(_JSON_CONTENT_TYPE):
+        return _CT_JSON
+    return _CT_OTHER
+
+
+def _prefix_path(prefix: str, path: str) -> str:
+    """Prepend the client's URL prefix to a schema index path.
+
+    Leading and trailing slashes are stripped, and paths that already
+    start with the prefix are not prefixed again, so a schema that was
+    normalized once is returned unchanged.
+
+    Args:
+        prefix: URL prefix (already ending in ``/``, or empty).
+        path: Index path referenced by a ``_schema``.
+
+    Returns:
+        str: The prefixed path.
+    """
+    path = path.strip('/')
+    if prefix and path.startswith(prefix):
+        return path
+    return f'{prefix}{path}'
+
+
+def _normalize_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Convert API method params into query-string params.
+
+    Double underscores in keys become dots (``a__b`` -> ``a.b``), booleans
+    become ``1``/``0``, and optional flags (``commit``, ``volatile``,
+    ``pretty``, ``indent``) are dropped when falsy.
+
+    Args:
+        params: Params as built by the API methods.
+
+    Returns:
+        dict: Params ready to be sent with the request.
+    """
+    return {
+        (k.replace('__', '.') if '__' in k else k): int(v) if v.__class__ is bool else v
+        for k, v in params.items()
+        if k not in _OPTIONAL_FLAG_PARAMS or v
+    }
+
+
+@lru_cache(maxsize=64)
+def _override_headers(accept: str | None, content_type: str | None) -> Mapping[str, str]:
+    """Build a read-only header mapping for an ``accept``/``content_type`` override.
+
+    Memoized and immutable, so API methods called repeatedly with the same
+    override share one mapping instead of building a dict per request.
+
+    Args:
+        accept: ``Accept`` header value, or ``None``.
+        content_type: ``Content-Type`` header value, or ``None``.
+
+    Returns:
+        Mapping[str, str]: The headers to send.
+    """
+    headers = {}
+    if accept is not None:
+        headers['accept'] = accept
+    if content_type is not None:
+        headers['content-type'] = content_type
+    return MappingProxyType(headers)
+
+
+def _request_kwargs(kwargs: dict | None, accept: str | None = None,
+        content_type: str | None = None) -> dict[str, Any]:
+    """Copy an API method's ``kwargs`` argument for ``_send_request``.
+
+    API methods add their own ``id``, ``body``, ``params``, and header
+    entries; doing so on a copy leaves the caller's dict (and its
+    ``headers``) untouched, so the same ``kwargs`` can be reused across
+    calls.
+
+    Args:
+        kwargs: The ``kwargs`` argument given to the API method, if any.
+        accept: Optional ``Accept`` header override.
+        content_type: Optional ``Content-Type`` header override.
+
+    Returns:
+        dict[str, Any]: A new dict of keyword arguments for
+            ``_send_request``.
+    """
+    kwargs = {**kwargs} if kwargs else {}
+    if accept is not None or content_type is not None:
+        headers = kwargs.get('headers')
+        if headers:
+            kwargs['headers'] = {**headers, **_override_headers(accept, content_type)}
+        else:
+            kwargs['headers'] = _override_headers(accept, content_type)
+    return kwargs
+
+
+# Exact-type serializers tried before the ``isinstance`` checks in
+# ``_serialize_default`` (subclasses fall through to those checks).
+_SERIALIZERS = {
+    Decimal: float,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+}
+
+
 def _serialize_default(obj: Any) -> float | str:
-    """Default serializer for json.dumps() and msgpack.dumps().
+    """Default serializer for JSON (stdlib or orjson) and msgpack encoding.
 
     Handles types that are not natively serializable by JSON/msgpack:
     ``Decimal`` is converted to ``float``, and ``datetime``, ``date``,
@@ -167,6 +470,9 @@ def _serialize_default(obj: Any) -> float | str:
     Raises:
         TypeError: If the object type is not supported.
     """
+    serialize = _SERIALIZERS.get(obj.__class__)
+    if serialize is not None:
+        return serialize(obj)
     if isinstance(obj, Decimal):
         return float(obj)
     if isinstance(obj, (datetime, date, time)):
@@ -174,6 +480,107 @@ def _serialize_default(obj: Any) -> float | str:
     raise TypeError(f"Object of type {type(obj).__name__} is not JSON/msgpack serializable")
 
 
+@lru_cache(maxsize=1024)
+def _index_paths(prefix: str, index: str | tuple[str, ...]) -> tuple[str, ...]:
+    """Resolve (and memoize) the prefixed path of each requested index.
+
+    The index part of a URL rarely changes between requests while the
+    document ID does, so it is cached separately from the full URL.
+
+    Args:
+        prefix: URL prefix (already ending in ``/``, or empty).
+        index: Comma-separated index names or a tuple of index names.
+
+    Returns:
+        tuple[str, ...]: The deduplicated, prefixed index paths, in the
+            order they were given.
+    """
+    if isinstance(index, str):
+        if ',' not in index:
+            return (f'{prefix}{index.strip("/")}',)
+        index = index.split(',')
+    return tuple(f'{prefix}{i}' for i in dict.fromkeys(i.strip('/') for i in index))
+
+
+@lru_cache(maxsize=1024)
+def _cached_url(prefix: str, action_request: str, index: str | tuple[str, ...],
+        host: str, port: str | int, nodename: str | None, id: str | None) -> str:
+    """Build (and memoize) a Xapiand request URL from hashable components.
+
+    Repeated requests against the same index and action reuse the
+    previously built URL; requests for new document IDs only append the
+    ID to the cached index paths from ``_index_paths``.
+
+    Args:
+        prefix: URL prefix (already ending in ``/``, or empty).
+        action_request: The action type (e.g., ``'search'``, ``'get'``).
+        index: Comma-separated index names or a tuple of index names.
+        host: Server hostname.
+        port: Server port.
+        nodename: Optional node name to route the request to.
+        id: Optional document ID.
+
+    Returns:
+        str: The fully constructed URL.
+    """
+    paths = _index_paths(prefix, index)
+    id = id or ''
+    if len(paths) == 1:
+        index = f'{paths[0]}/{id}'
+    else:
+        index = ','.join([f'{path}/{id}' for path in paths])
+
+    nodename = f'@{nodename}' if nodename else ''
+
+    if action_request in ('search', 'stats',):
+        action_request = f'{COMMAND_PREFIX}{action_request}'
+    else:
+        action_request = ''
+
+    return f'http://{host}:{port}/{index}{nodename}{action_request}'
+
+
+def _commit_target(arguments: dict[str, Any]) -> tuple:
+    """Key identifying the index a bulk write operation commits.
+
+    Args:
+        arguments: Keyword arguments of a write operation passed to ``bulk``.
+
+    Returns:
+        tuple: The index (a frozenset for multi-index specs), host, and port
+            the write is sent to.
+    """
+    index = arguments.get('index')
+    if index is not None and not isinstance(index, str):
+        index = frozenset(index)
+    kwargs = arguments.get('kwargs') or {}
+    return index, kwargs.get('host'), kwargs.get('port')
+
+
+class _LoopSession:
+    """Non-data descriptor resolving ``Xapiand.session`` per event loop.
+
+    Being a non-data descriptor, an explicit ``client.session = ...``
+    assignment still takes precedence over the per-loop lookup.
+    """
+
+    def __get__(self, instance: Xapiand | None, owner: type | None = None) -> Any:
+        """Return the session of ``instance`` for the running event loop.
+
+        Args:
+            instance: The ``Xapiand`` instance the attribute is read from,
+                or ``None`` when accessed on the class.
+            owner: The class the descriptor is accessed through.
+
+        Returns:
+            The descriptor itself when accessed on the class, otherwise
+            ``instance._get_session()``.
+        """
+        if instance is None:
+            return self
+        return instance._get_session()
+
+
 class Xapiand:
     """Async client for communicating with a Xapiand search engine server.
 
@@ -187,10 +594,13 @@ class Xapiand:
     Attributes:
         host: Xapiand server hostname.
         port: Xapiand server port.
+        http2: Whether requests are sent over HTTP/2.
         commit: Whether to commit changes immediately by default.
         prefix: URL prefix prepended to all index paths.
         default_accept: Default ``Accept`` header for requests.
         default_accept_encoding: Default ``Accept-Encoding`` header.
+        session: The ``httpx.AsyncClient`` holding the keep-alive connection
+            pool to the server. Each event loop gets its own session.
         NotFoundError: Reference to the ``NotFoundError`` exception class.
         NA: Sentinel object indicating no default value was provided.
 
@@ -202,29 +612,42 @@ class Xapiand:
 
     NotFoundError = NotFoundError
     NA = NA
+    session = _LoopSession()
+
+    DEFAULT_MAX_CONNECTIONS = XAPIAND_MAX_CONNECTIONS
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 200
+    DEFAULT_KEEPALIVE_EXPIRY = XAPIAND_KEEPALIVE_EXPIRY
 
-    session = httpx.AsyncClient(
-        limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
-        trust_env=False,
-        follow_redirects=False,
-    )
     _methods = dict(
-        search=('GET', 'results'),
-        stats=('GET', 'result'),
-        get=('GET', 'result'),
-        delete=('DELETE', 'result'),
-        head=('HEAD', 'result'),
-        post=('POST', 'result'),
-        put=('PUT', 'result'),
-        patch=('PATCH', 'result'),
-        merge=('MERGE', 'result'),
-        store=('STORE', 'result'),
+        search='GET',
+        stats='GET',
+        get='GET',
+        delete='DELETE',
+        head='HEAD',
+        post='POST',
+        put='PUT',
+        patch='PATCH',
+        merge='MERGE',
+        store='STORE',
     )
 
+    _bulk_methods = frozenset((
+        'search', 'stats', 'head', 'count', 'get', 'delete', 'post', 'put',
+        'index', 'patch', 'update', 'merge', 'store',
+    ))
+
+    _bulk_write_methods = frozenset((
+        'delete', 'post', 'put', 'index', 'patch', 'update', 'merge', 'store',
+    ))
+
     def __init__(self, host: str | None = None, port: str | int | None = None,
             commit: bool | None = None, prefix: str | None = None,
             default_accept: str | None = None,
             default_accept_encoding: str | None = None,
+            max_connections: int | None = None,
+            max_keepalive_connections: int | None = None,
+            keepalive_expiry: float | None = None,
+            http2: bool | None = None,
             *args, **kwargs) -> None:
         """Initialize the Xapiand client.
 
@@ -242,9 +665,32 @@ class Xapiand:
                 ``'application/x-msgpack'`` if msgpack is available,
                 otherwise ``'application/json'``.
             default_accept_encoding: Default ``Accept-Encoding`` header.
-                Defaults to ``'deflate, gzip, identity'``.
+                Defaults to ``DEFAULT_ACCEPT_ENCODING``: ``'deflate, gzip,
+                identity'``, preceded by ``zstd`` and ``br`` when the
+                ``zstandard`` / ``brotli`` packages are installed.
+            max_connections: Maximum number of concurrent connections in
+                the session's connection pool. Defaults to
+                ``DEFAULT_MAX_CONNECTIONS``, taken from the
+                ``XAPIAND_MAX_CONNECTIONS`` environment variable or
+                ``1000``.
+            max_keepalive_connections: Maximum number of idle connections
+                kept alive for reuse. Defaults to
+                ``DEFAULT_MAX_KEEPALIVE_CONNECTIONS`` (``200``).
+            keepalive_expiry: Seconds an idle connection is kept open.
+                Defaults to ``DEFAULT_KEEPALIVE_EXPIRY``, taken from the
+                ``XAPIAND_KEEPALIVE_EXPIRY`` environment variable or
+                ``60``.
+            http2: If ``True``, talk HTTP/2 (cleartext, with prior
+                knowledge) to the server so concurrent requests are
+                multiplexed over a single connection. Requires the ``h2``
+                package (``pip install pyxapiand[http2]``). Defaults to the
+                ``XAPIAND_HTTP2`` environment variable or ``False``.
             *args: Additional positional arguments (unused).
             **kwargs: Additional keyword arguments (unused).
+
+        Raises:
+            ImportError: If ``http2`` is requested but ``h2`` is not
+                installed.
         """
         if host is None:
             host = XAPIAND_HOST
@@ -258,15 +704,141 @@ class Xapiand:
         self.port = port
         self.commit = commit
         self.prefix = f'{prefix}/' if prefix else ''
+        self._default_headers = {}
         if default_accept is None:
             default_accept = 'application/json' if msgpack is None else 'application/x-msgpack'
         self.default_accept = default_accept
         if default_accept_encoding is None:
-            default_accept_encoding = 'deflate, gzip, identity'
+            default_accept_encoding = DEFAULT_ACCEPT_ENCODING
         self.default_accept_encoding = default_accept_encoding
 
+        if http2 is None:
+            http2 = XAPIAND_HTTP2
+        if http2 and h2 is None:
+            raise ImportError("HTTP/2 support requires the installation of the h2 module.")
+        self.http2 = http2
+        if max_connections is None:
+            max_connections = self.DEFAULT_MAX_CONNECTIONS
+        if max_keepalive_connections is None:
+            max_keepalive_connections = self.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        if keepalive_expiry is None:
+            keepalive_expiry = self.DEFAULT_KEEPALIVE_EXPIRY
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._sessions = weakref.WeakKeyDictionary()
+        self._unbound_session = None
+        self._local = threading.local()
+
         self.DoesNotExist = NotFoundError
 
+    @property
+    def default_accept(self) -> str:
+        """Default ``Accept`` header sent with every request."""
+        return self._default_headers['accept']
+
+    @default_accept.setter
+    def default_accept(self, value: str) -> None:
+        """Set the default ``Accept`` header.
+
+        The value is also the default ``Content-Type`` of request bodies.
+
+        Args:
+            value: The new ``Accept`` header value.
+        """
+        self._default_headers = {**self._default_headers, 'accept': value, 'content-type': value}
+        self._default_kind = _content_kind(value)
+
+    @property
+    def default_accept_encoding(self) -> str:
+        """Default ``Accept-Encoding`` header sent with every request."""
+        return self._default_headers['accept-encoding']
+
+    @default_accept_encoding.setter
+    def default_accept_encoding(self, value: str) -> None:
+        """Set the default ``Accept-Encoding`` header.
+
+        Args:
+            value: The new ``Accept-Encoding`` header value.
+        """
+        self._default_headers = {**self._default_headers, 'accept-encoding': value}
+
+    def _build_session(self) -> httpx.AsyncClient:
+        """Create a new ``httpx.AsyncClient`` with this client's pool limits.
+
+        Returns:
+            A fresh ``httpx.AsyncClient`` with keep-alive enabled, speaking
+            HTTP/2 when ``self.http2`` is set.
+        """
+        return httpx.AsyncClient(
+            limits=self._limits,
+            http1=not self.http2,
+            http2=self.http2,
+            headers={'connection': 'keep-alive'},
+            trust_env=False,
+            follow_redirects=False,
+        )
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """Return the session bound to the running event loop.
+
+        An ``httpx.AsyncClient`` (and its connection pool) must only be used
+        from the event loop it was first used on, so a separate session is
+        lazily built for each loop. Sessions are dropped together with
+        their loop. Outside of a running loop a single unbound session is
+        returned.
+
+        Returns:
+            The ``httpx.AsyncClient`` for the current event loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            session = self._unbound_session
+            if session is None or session.is_closed:
+                session = self._unbound_session = self._build_session()
+            return session
+        session = self._sessions.get(loop)
+        if session is None or session.is_closed:
+            session = self._sessions[loop] = self._build_session()
+        return session
+
+    def _pack(self, obj: Any) -> bytes:
+        """Encode a request body with this thread's msgpack packer.
+
+        A ``Packer`` is reused between requests so that each one does not
+        construct a new packer (as ``msgpack.dumps`` does), but it keeps
+        internal buffer state and is not thread-safe, so each thread (and
+        hence each event loop running in it) gets its own.
+
+        Args:
+            obj: The body to encode.
+
+        Returns:
+            bytes: The msgpack-encoded body.
+        """
+        local = self._local
+        try:
+            packer = local.packer
+        except AttributeError:
+            packer = local.packer = msgpack.Packer(default=_serialize_default)
+        return packer.pack(obj)
+
+    @cached_property
+    def _encoders(self) -> dict[int, Callable[[Any], bytes | str]]:
+        """Request body encoders by payload kind.
+
+        Returns:
+            dict: Maps ``_CT_JSON`` (and ``_CT_MSGPACK`` when msgpack is
+                installed) to the function that serializes a body.
+        """
+        encoders = {_CT_JSON: _json_dumps}
+        if msgpack is not None:
+            encoders[_CT_MSGPACK] = self._pack
+        return encoders
+
     def _build_url(self, action_request: str, index: IndexSpec,
             host: str | None, port: str | int | None,
             nodename: str | None, id: str | None) -> str:
@@ -275,6 +847,9 @@ class Xapiand:
         Constructs a URL following the scheme:
         ``http://{host}:{port}/{prefix}{index}/{id}{@nodename}{:command}``
 
+        Arguments are normalized to hashable values and the URL itself is
+        built by the memoized ``_cached_url``.
+
         Args:
             action_request: The action type (e.g., ``'search'``, ``'get'``,
                 ``'stats'``). Actions ``'search'`` and ``'stats'`` are
@@ -289,28 +864,21 @@ class Xapiand:
         Returns:
             str: The fully constructed URL.
         """
-        if host and ':' in host:
-            host, _, port = host.partition(':')
-        if not host:
+        if not host and not port:
             host = self.host
-        if not port:
             port = self.port
-        host = f'{host}:{port}'
-
-        if not isinstance(index, (tuple, list, set)):
-            index = index.split(',')
-
-        indexes = [f'{self.prefix}{i.strip("/")}' for i in set(index)]
-        index = ','.join(['/'.join((i, id or '')) for i in indexes])
-
-        nodename = f'@{nodename}' if nodename else ''
-
-        if action_request in ('search', 'stats',):
-            action_request = f'{COMMAND_PREFIX}{action_request}'
         else:
-            action_request = ''
+            if host and ':' in host:
+                host, _, port = host.partition(':')
+            if not host:
+                host = self.host
+            if not port:
+                port = self.port
+
+        if isinstance(index, (tuple, list, set)):
+            index = tuple(sorted(set(index)))
 
-        return f'http://{host}/{index}{nodename}{action_request}'
+        return _cached_url(self.prefix, action_request, index, host, port, nodename, id)
 
     async def _send_request(self, action_request: str, index: IndexSpec,
             host: str | None = None, port: str | int | None = None,
@@ -333,7 +901,8 @@ class Xapiand:
             port: Server port override.
             nodename: Node name to route the request to.
             id: Document ID for the request.
-            body: Request body. Can be a dict, list, or file path string.
+            body: Request body. Can be a dict, list, already encoded
+                ``bytes``, or a file path (string or ``os.PathLike``).
             default: Default value to return on 404 for ``patch``,
                 ``merge``, ``delete``, and ``get`` actions. If not
                 provided (``NA``), a ``NotFoundError`` is raised instead.
@@ -355,74 +924,75 @@ class Xapiand:
                 (other than handled 404s).
         """
 
-        http_method, key = self._methods[action_request]
+        if body is not None and action_request == 'search':
+            http_method = 'POST'
+        else:
+            http_method = self._methods[action_request]
         url = self._build_url(action_request, index, host, port, nodename, id)
 
-        if action_request == 'search' and body is not None:
-            http_method, key = self._methods['post']
-
         params = kwargs.pop('params', None)
         if params is not None:
-            kwargs['params'] = {
-                k.replace('__', '.'): (v and 1 or 0) if isinstance(v, bool) else v
-                for k, v in params.items()
-                if k not in ('commit', 'volatile', 'pretty', 'indent') or v
-            }
-
-        headers = kwargs.setdefault('headers', {})
-        accept = headers.setdefault('accept', self.default_accept)
-        headers.setdefault('accept-encoding', self.default_accept_encoding)
+            kwargs['params'] = _normalize_params(params)
+
+        # The prebuilt default headers are shared, never mutated, on the common path.
+        headers = kwargs.get('headers')
+        if headers:
+            extra = headers
+            headers = {**self._default_headers, **extra}
+            if 'content-type' not in extra:
+                headers['content-type'] = headers['accept']
+            kind = None
+        else:
+            headers = self._default_headers
+            kind = self._default_kind
 
         if 'json' in kwargs:
             body = kwargs.pop('json')
-            headers['content-type'] = 'application/json'
-            is_msgpack = False
-            is_json = True
+            headers = {**headers, 'content-type': _JSON_CONTENT_TYPE}
+            kind = _CT_JSON
         elif 'msgpack' in kwargs:
             body = kwargs.pop('msgpack')
-            headers['content-type'] = 'application/x-msgpack'
-            is_msgpack = True
-            is_json = False
-        else:
-            content_type = headers.setdefault('content-type', accept)
-            is_msgpack = 'application/x-msgpack' in content_type
-            is_json = 'application/json' in content_type
+            headers = {**headers, 'content-type': _MSGPACK_CONTENT_TYPE}
+            kind = _CT_MSGPACK
+        elif kind is None:
+            kind = _content_kind(headers['content-type'])
+        kwargs['headers'] = headers
 
         if body is not None:
-            if isinstance(body, dict):
-                if '_schema' in body:
-                    body = body.copy()
-                    schema = body['_schema']
-                    if isinstance(schema, dict):
-                        schema['_foreign'] = f"{self.prefix}{schema['_foreign'].strip('/')}"
-                    else:
-                        schema = f"{self.prefix}{schema.strip('/')}"
-                    body['_schema'] = schema
-            if logger.isEnabledFor(logging.DEBUG):
-                try:
-                    verb_body = json.dumps(body, ensure_ascii=True, default=_serialize_default)
-                except Exception:
-                    verb_body = body
-                logger.debug(f"@@@>> URL: {url}  ::  BODY: {verb_body}  ::  KWARGS: {kwargs}")
+            if isinstance(body, dict) and '_schema' in body:
+                # The caller's body (and its nested schema) are never mutated;
+                # copies are only made when the schema path actually changes.
+                schema = body['_schema']
+                if isinstance(schema, dict):
+                    foreign = schema['_foreign']
+                    prefixed = _prefix_path(self.prefix, foreign)
+                    if prefixed != foreign:
+                        body = {**body, '_schema': {**schema, '_foreign': prefixed}}
+                else:
+                    prefixed = _prefix_path(self.prefix, schema)
+                    if prefixed != schema:
+                        body = {**body, '_schema': prefixed}
             if isinstance(body, (dict, list)):
-                if is_msgpack:
-                    body = msgpack.dumps(body, default=_serialize_default)
-                elif is_json:
-                    body = json.dumps(body, ensure_ascii=True, default=_serialize_default)
-            elif os.path.isfile(body):
-                body = open(body, 'r')
+                encode = self._encoders.get(kind)
+                if encode is not None:
+                    body = encode(body)
+            elif isinstance(body, (bytearray, memoryview)):
+                body = bytes(body)
+            elif _is_file_path(body):
+                kwargs['headers'] = {**kwargs['headers'], 'content-length': str(os.path.getsize(body))}
+                body = _iter_file(body)
+            logger.debug("@@@>> URL: %s  ::  BODY: %.512r  ::  KWARGS: %r", url, body, kwargs)
             res = await self.session.request(http_method, url, content=body, **kwargs)
         else:
             data = kwargs.pop('data', None)
             if data:
-                if is_msgpack:
-                    kwargs['content'] = msgpack.dumps(data, default=_serialize_default)
-                elif is_json:
-                    kwargs['content'] = json.dumps(data, ensure_ascii=True, default=_serialize_default)
-            logger.debug(f"@@@>> URL: {url}  ::  KWARGS: {kwargs}")
+                encode = self._encoders.get(kind)
+                if encode is not None:
+                    kwargs['content'] = encode(data)
+            logger.debug("@@@>> URL: %s  ::  KWARGS: %r", url, kwargs)
             res = await self.session.request(http_method, url, **kwargs)
 
-        if res.status_code == 404 and action_request in ('patch', 'merge', 'delete', 'get'):
+        if res.status_code == 404 and action_request in _NOT_FOUND_ACTIONS:
             if default is NA:
                 raise self.NotFoundError("Matching query does not exist.")
             return default
@@ -430,30 +1000,24 @@ class Xapiand:
             try:
                 res.raise_for_status()
             except Exception as exc:
-                print(f"@@@RRES>> {exc} :: {res.content}")
-                logger.debug(f"@@@RES>> {exc}")
+                logger.debug("@@@RES>> %s :: %.512r", exc, res.content)
                 raise
 
-        content_type = res.headers.get('content-type', '')
-        is_msgpack = 'application/x-msgpack' in content_type
-        is_json = 'application/json' in content_type
-
-        if is_msgpack:
-            content = msgpack.loads(res.content, object_pairs_hook=_deserialize_object_pairs_hook)
-        elif is_json:
-            content = json.loads(res.content, object_pairs_hook=_deserialize_object_pairs_hook, parse_float=Decimal)
-        else:
+        decode = _DECODERS.get(_content_kind(res.headers.get('content-type', '')))
+        if decode is None:
             return res.content
+        content = decode(res.content)
 
-        results = content.pop(RESPONSE_QUERY, DictObject())
-        agg = content.pop(RESPONSE_AGGREGATIONS, DictObject())
+        results = content.pop(RESPONSE_QUERY, None)
+        agg = content.pop(RESPONSE_AGGREGATIONS, None)
 
         if results:
-            results['hits'] = results.pop('#hits')
-            results['count'] = results.pop('#total_count')
-            results['total'] = results.pop('#matches_estimated')
+            for src, dst in _SEARCH_RESULT_KEYS:
+                results[dst] = results.pop(src)
 
         if agg:
+            if results is None:
+                results = DictObject()
             results['aggregations'] = agg
 
         if results:
@@ -492,41 +1056,36 @@ class Xapiand:
                 documents), ``count`` (total count), ``total`` (estimated
                 matches), and optionally ``aggregations``.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs)
         kwargs.update(kw)
-        kwargs['params'] = dict(
-            pretty=pretty,
-            volatile=volatile,
-        )
-        if query is not None:
-            kwargs['params']['query'] = query
-        if partial is not None:
-            kwargs['params']['partial'] = partial
-        if terms is not None:
-            kwargs['params']['terms'] = terms
-        if limit is not None:
-            kwargs['params']['limit'] = limit
-        if check_at_least is not None:
-            kwargs['params']['check_at_least'] = check_at_least
-        if sort is not None:
-            kwargs['params']['sort'] = sort
-        if language is not None:
-            kwargs['params']['language'] = language
+        kwargs['params'] = params = {
+            k: v for k, v in (
+                ('pretty', pretty),
+                ('volatile', volatile),
+                ('query', query),
+                ('partial', partial),
+                ('terms', terms),
+                ('limit', limit),
+                ('check_at_least', check_at_least),
+                ('sort', sort),
+                ('language', language),
+            ) if v is not None
+        }
         if offset is not None:
             try:
                 offset = int(offset)
             except ValueError:
-                logger.debug(f"@@@>> INVALID OFFSET: {offset} (type: {type(offset)})")
-                kwargs['params']['offset'] = 0
+                logger.debug("@@@>> INVALID OFFSET: %s (type: %s)", offset, type(offset))
+                params['offset'] = 0
             else:
                 if offset > OFFSET_LIMIT:  # the offset was probably sent wrong in this case
                     logger.debug(
-                        f"@@@>> PROBABLY ERR OFFSET: {offset} (type: {type(offset)})"
-                        f" :: INDEX: {index} :: KWARGS: {kwargs}"
+                        "@@@>> PROBABLY ERR OFFSET: %s (type: %s) :: INDEX: %s :: KWARGS: %s",
+                        offset, type(offset), index, kwargs,
                     )
-                    kwargs['params']['offset'] = 0
+                    params['offset'] = 0
                 else:
-                    kwargs['params']['offset'] = offset
+                    params['offset'] = offset
         return await self._send_request('search', index, **kwargs)
 
     async def stats(self, index: IndexSpec, pretty: bool = False,
@@ -542,10 +1101,8 @@ class Xapiand:
         Returns:
             DictObject: Index statistics from the server.
         """
-        kwargs = kwargs or {}
-        kwargs['params'] = dict(
-            pretty=pretty,
-        )
+        kwargs = _request_kwargs(kwargs)
+        kwargs['params'] = {'pretty': pretty}
         return await self._send_request('stats', index, **kwargs)
 
     async def head(self, index: IndexSpec, id: str, pretty: bool = False,
@@ -562,11 +1119,9 @@ class Xapiand:
         Returns:
             DictObject: Response headers/metadata from the server.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs)
         kwargs['id'] = id
-        kwargs['params'] = dict(
-            pretty=pretty,
-        )
+        kwargs['params'] = {'pretty': pretty}
         return await self._send_request('head', index, **kwargs)
 
     async def count(self, index: IndexSpec, body: dict | list | str | None = None,
@@ -591,11 +1146,11 @@ class Xapiand:
         Returns:
             DictObject: Search results containing the document count.
         """
-        kwargs = kwargs or {}
-        kwargs['params'] = dict(
-            pretty=pretty,
-            volatile=volatile,
-        )
+        kwargs = _request_kwargs(kwargs)
+        kwargs['params'] = {
+            'pretty': pretty,
+            'volatile': volatile,
+        }
         kwargs['params'].update(kw)
         if query is not None:
             kwargs['params']['query'] = query
@@ -628,16 +1183,12 @@ class Xapiand:
             NotFoundError: If the document is not found and no ``default``
                 was provided.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs, accept=accept)
         kwargs['id'] = id
-        if accept is not None:
-            kwargs['headers'] = {}
-            kwargs['headers']['accept'] = accept
-
-        kwargs['params'] = dict(
-            pretty=pretty,
-            volatile=volatile,
-        )
+        kwargs['params'] = {
+            'pretty': pretty,
+            'volatile': volatile,
+        }
         kwargs['default'] = default
         return await self._send_request('get', index, **kwargs)
 
@@ -660,85 +1211,97 @@ class Xapiand:
         Raises:
             NotFoundError: If the document is not found.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs)
         kwargs['id'] = id
-        kwargs['params'] = dict(
-            commit=self.commit if commit is None else commit,
-            pretty=pretty,
-        )
+        kwargs['params'] = {
+            'commit': self.commit if commit is None else commit,
+            'pretty': pretty,
+        }
         return await self._send_request('delete', index, **kwargs)
 
-    async def post(self, index: IndexSpec, body: dict | list | str,
+    async def post(self, index: IndexSpec, body: dict | list | str | bytes,
             commit: bool | None = None, pretty: bool = False,
-            kwargs: dict | None = None) -> DictObject:
+            kwargs: dict | None = None, content_type: str | None = None) -> DictObject:
         """Create a new document in an index (server-assigned ID).
 
         Args:
             index: Index name to create the document in.
-            body: Document body as a dict, list, or file path.
+            body: Document body as a dict, list, file path, or already
+                serialized bytes.
             commit: Whether to commit immediately. Defaults to
                 ``self.commit``.
             pretty: If ``True``, request pretty-printed response.
             kwargs: Additional keyword arguments dict passed to
                 ``_send_request``.
+            content_type: Optional ``Content-Type`` header override. Use it
+                to label an already serialized ``bytes`` body (e.g.
+                ``'application/x-msgpack'``), which is sent as-is.
 
         Returns:
             DictObject: Server response with the created document metadata.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs, content_type=content_type)
         kwargs['body'] = body
-        kwargs['params'] = dict(
-            commit=self.commit if commit is None else commit,
-            pretty=pretty,
-        )
+        kwargs['params'] = {
+            'commit': self.commit if commit is None else commit,
+            'pretty': pretty,
+        }
         return await self._send_request('post', index, **kwargs)
 
-    async def put(self, index: IndexSpec, body: dict | list | str, id: str,
+    async def put(self, index: IndexSpec, body: dict | list | str | bytes, id: str,
             commit: bool | None = None, pretty: bool = False,
-            kwargs: dict | None = None) -> DictObject:
+            kwargs: dict | None = None, content_type: str | None = None) -> DictObject:
         """Create or replace a document with a specific ID.
 
         Args:
             index: Index name for the document.
-            body: Document body as a dict, list, or file path.
+            body: Document body as a dict, list, file path, or already
+                serialized bytes.
             id: Document ID to assign.
             commit: Whether to commit immediately. Defaults to
                 ``self.commit``.
             pretty: If ``True``, request pretty-printed response.
             kwargs: Additional keyword arguments dict passed to
                 ``_send_request``.
+            content_type: Optional ``Content-Type`` header override. Use it
+                to label an already serialized ``bytes`` body (e.g.
+                ``'application/x-msgpack'``), which is sent as-is.
 
         Returns:
             DictObject: Server response with the document metadata.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs, content_type=content_type)
         kwargs['id'] = id
         kwargs['body'] = body
-        kwargs['params'] = dict(
-            commit=self.commit if commit is None else commit,
-            pretty=pretty,
-        )
+        kwargs['params'] = {
+            'commit': self.commit if commit is None else commit,
+            'pretty': pretty,
+        }
         return await self._send_request('put', index, **kwargs)
 
-    async def index(self, index: IndexSpec, body: dict | list | str, id: str,
+    async def index(self, index: IndexSpec, body: dict | list | str | bytes, id: str,
             commit: bool | None = None, pretty: bool = False,
-            kwargs: dict | None = None) -> DictObject:
+            kwargs: dict | None = None, content_type: str | None = None) -> DictObject:
         """Create or replace a document (alias for ``put``).
 
         Args:
             index: Index name for the document.
-            body: Document body as a dict, list, or file path.
+            body: Document body as a dict, list, file path, or already
+                serialized bytes.
             id: Document ID to assign.
             commit: Whether to commit immediately. Defaults to
                 ``self.commit``.
             pretty: If ``True``, request pretty-printed response.
             kwargs: Additional keyword arguments dict passed to
                 ``_send_request``.
+            content_type: Optional ``Content-Type`` header override. Use it
+                to label an already serialized ``bytes`` body (e.g.
+                ``'application/x-msgpack'``), which is sent as-is.
 
         Returns:
             DictObject: Server response with the document metadata.
         """
-        return await self.put(index, body, id, commit, pretty, kwargs)
+        return await self.put(index, body, id, commit, pretty, kwargs, content_type)
 
     async def patch(self, index: IndexSpec, id: str, body: dict | list | str,
             commit: bool | None = None, pretty: bool = False,
@@ -764,13 +1327,13 @@ class Xapiand:
         Raises:
             NotFoundError: If the document is not found.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs)
         kwargs['id'] = id
         kwargs['body'] = body
-        kwargs['params'] = dict(
-            commit=self.commit if commit is None else commit,
-            pretty=pretty,
-        )
+        kwargs['params'] = {
+            'commit': self.commit if commit is None else commit,
+            'pretty': pretty,
+        }
         return await self._send_request('patch', index, **kwargs)
 
     async def update(self, index: IndexSpec, id: str, body: dict | list | str,
@@ -798,11 +1361,8 @@ class Xapiand:
         Returns:
             DictObject: Server response with the document metadata.
         """
-        kwargs = kwargs or {}
         if content_type is not None:
-            kwargs.setdefault('headers', {})
-            kwargs['headers']['content-type'] = content_type
-            return await self.put(index, body, id, commit, pretty, kwargs)
+            return await self.put(index, body, id, commit, pretty, kwargs, content_type)
         return await self.merge(
             index=index,
             id=id,
@@ -839,16 +1399,13 @@ class Xapiand:
         Raises:
             NotFoundError: If the document is not found.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs, content_type=content_type)
         kwargs['id'] = id
         kwargs['body'] = body
-        if content_type is not None:
-            kwargs.setdefault('headers', {})
-            kwargs['headers']['content-type'] = content_type
-        kwargs['params'] = dict(
-            commit=self.commit if commit is None else commit,
-            pretty=pretty,
-        )
+        kwargs['params'] = {
+            'commit': self.commit if commit is None else commit,
+            'pretty': pretty,
+        }
         return await self._send_request('merge', index, **kwargs)
 
     async def store(self, index: IndexSpec, id: str, body: dict | list | str,
@@ -869,14 +1426,152 @@ class Xapiand:
         Returns:
             DictObject: Server response confirming storage.
         """
-        kwargs = kwargs or {}
+        kwargs = _request_kwargs(kwargs)
         kwargs['id'] = id
         kwargs['body'] = body
-        kwargs['params'] = dict(
-            commit=self.commit if commit is None else commit,
-            pretty=pretty,
-        )
+        kwargs['params'] = {
+            'commit': self.commit if commit is None else commit,
+            'pretty': pretty,
+        }
         return await self._send_request('store', index, **kwargs)
 
+    async def bulk(self, operations: Iterable[tuple[str, dict]],
+            return_exceptions: bool = False, commit: bool | None = None,
+            concurrency: int | None = None) -> list:
+        """Run several API calls concurrently over the pooled session.
+
+        All requests are issued at once with ``asyncio.gather`` and share
+        the keep-alive connections of the current event loop's session, so
+        N independent requests cost roughly one round-trip instead of N.
+
+        Args:
+            operations: Iterable of ``(method, arguments)`` pairs, where
+                ``method`` is the name of a public API method (e.g.
+                ``'index'``, ``'get'``, ``'search'``) and ``arguments`` is
+                a dict of keyword arguments for it.
+            return_exceptions: If ``True``, exceptions raised by individual
+                operations are returned in place of their results instead
+                of being propagated.
+            commit: If given, overrides ``commit`` for every write
+                operation. When ``True``, writes are sent without
+                committing and only the last write to each index (and
+                host) commits, once all the other operations have
+                completed, so every index is committed a single time for
+                the whole batch. If that last write fails, its index is
+                left uncommitted: the other writes to it are stored but
+                only become visible with the next commit to that index.
+            concurrency: Maximum number of requests in flight at once.
+                Defaults to ``None`` (no limit beyond the connection pool).
+
+        Returns:
+            list: Results in the same order as ``operations``.
+
+        Raises:
+            ValueError: If an operation names an unknown method.
+
+        Example:
+            >>> await client.bulk([
+            ...     ('index', {'index': 'books', 'id': '1', 'body': {'title': 'A'}}),
+            ...     ('index', {'index': 'books', 'id': '2', 'body': {'title': 'B'}}),
+            ... ], commit=True)
+        """
+        calls = []
+        last_writes = {}
+        for method, arguments in operations:
+            if method not in self._bulk_methods:
+                raise ValueError(f"Unknown bulk operation: {method!r}")
+            if commit is not None and method in self._bulk_write_methods:
+                arguments = {**arguments, 'commit': False}
+                if commit:
+                    last_writes[_commit_target(arguments)] = len(calls)
+            calls.append((method, arguments))
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def call(method: str, arguments: dict) -> Any:
+            if semaphore is None:
+                return await getattr(self, method)(**arguments)
+            async with semaphore:
+                return await getattr(self, method)(**arguments)
+
+        deferred = sorted(last_writes.values())
+        skip = set(deferred)
+        results = await asyncio.gather(
+            *(call(method, arguments) for i, (method, arguments) in enumerate(calls) if i not in skip),
+            return_exceptions=return_exceptions,
+        )
+        if deferred:
+            committed = await asyncio.gather(
+                *(call(calls[i][0], {**calls[i][1], 'commit': True}) for i in deferred),
+                return_exceptions=return_exceptions,
+            )
+            for i, result in zip(deferred, committed):
+                results.insert(i, result)
+        return results
+
+    async def merge_many(self, index: IndexSpec, items: Iterable[tuple[str, dict]],
+            concurrency: int = 32, commit: bool | None = None,
+            return_exceptions: bool = False) -> list:
+        """Merge several documents concurrently.
+
+        Shorthand for ``bulk`` with one ``merge`` operation per item, at most
+        ``concurrency`` of them in flight at a time so a large batch does
+        not flood the server.
+
+        Args:
+            index: Index name containing the documents.
+            items: Iterable of ``(id, body)`` pairs to merge.
+            concurrency: Maximum number of merges in flight at once.
+            commit: Passed to ``bulk``; ``True`` commits once, with the
+                last merge, instead of once per document. If that last
+                merge fails, the index is left uncommitted (see ``bulk``).
+            return_exceptions: If ``True``, exceptions raised by individual
+                merges are returned in place of their results.
+
+        Returns:
+            list: Results in the same order as ``items``.
+
+        Example:
+            >>> await client.merge_many('books', docs.items(), commit=True)
+        """
+        return await self.bulk(
+            (('merge', {'index': index, 'id': id, 'body': body}) for id, body in items),
+            return_exceptions=return_exceptions,
+            commit=commit,
+            concurrency=concurrency,
+        )
+
+    async def aclose(self) -> None:
+        """Close the session bound to the running event loop.
+
+        The next request made on this loop opens a new session.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        session = self._sessions.pop(loop, None) if loop is not None else None
+        if session is not None:
+            await session.aclose()
+        if self._unbound_session is not None:
+            await self._unbound_session.aclose()
+            self._unbound_session = None
+
+    async def __aenter__(self) -> Xapiand:
+        """Enter an ``async with`` block.
+
+        Returns:
+            Xapiand: The client itself.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the client's sessions by awaiting ``aclose()``.
+
+        Args:
+            *exc_info: Exception type, value, and traceback raised inside the
+                block (all ``None`` if it exited normally); not suppressed.
+        """
+        await self.aclose()
+
 
 client = Xapiand(host=XAPIAND_HOST, port=XAPIAND_PORT, commit=XAPIAND_COMMIT, prefix=XAPIAND_PREFIX)
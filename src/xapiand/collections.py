@@ -40,46 +40,30 @@ from typing import Any
 __all__ = ['DictObject', 'OrderedDictObject']
 
 
-class OrderedDictObject(OrderedDict):
-    """Ordered dictionary with attribute-style access.
-
-    Extends ``collections.OrderedDict`` so that keys can be accessed,
-    set, and deleted as object attributes while preserving insertion
-    order.
+class _AttributeAccess:
+    """Mixin mapping missing attributes to dictionary keys.
 
-    The implementation uses ``__new__`` to wire the instance's
-    ``__dict__`` to the dict storage itself, enabling transparent
-    attribute access.
-
-    Example:
-        >>> obj = OrderedDictObject([('a', 1), ('b', 2)])
-        >>> obj.a
-        1
-        >>> obj.c = 3
-        >>> list(obj.keys())
-        ['a', 'b', 'c']
+    ``__getattr__`` is only consulted when normal attribute lookup fails,
+    so dict methods such as ``keys`` or ``items`` keep working even when
+    the mapping holds a key with the same name (read it with
+    ``obj['keys']``). Setting and deleting attributes always act on keys.
     """
 
-    def __new__(cls, *args, **kwargs):
-        """Create a new ``OrderedDictObject`` instance.
+    __slots__ = ()
 
-        Wires the instance's ``__dict__`` to the underlying dict storage
-        so that attribute access maps directly to dict key access.
+    def __getattr__(self, name: str) -> Any:
+        """Return the value stored under ``name``.
 
         Args:
-            *args: Positional arguments passed to ``OrderedDict``.
-            **kwargs: Keyword arguments passed to ``OrderedDict``.
+            name: Attribute/key name.
 
-        Returns:
-            OrderedDictObject: A new instance with attribute-style access.
+        Raises:
+            AttributeError: If the key does not exist.
         """
-        attrs = getattr(OrderedDict(), '__dict__', {})
-        attrs.update(cls.__dict__)
-        obj = type(cls.__name__, cls.__bases__, attrs)
-        self = OrderedDict.__new__(obj, *args, **kwargs)
-        OrderedDict.__setattr__(self, '__dict__', self)
-        OrderedDict.__init__(self, *args, **kwargs)
-        return self
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Set an attribute by delegating to ``__setitem__``.
@@ -88,7 +72,7 @@ class OrderedDictObject(OrderedDict):
             name: Attribute/key name.
             value: Value to assign.
         """
-        self.__setitem__(name, value)
+        self[name] = value
 
     def __delattr__(self, name: str) -> None:
         """Delete an attribute by delegating to ``__delitem__``.
@@ -97,16 +81,39 @@ class OrderedDictObject(OrderedDict):
             name: Attribute/key name to delete.
 
         Raises:
-            KeyError: If the key does not exist.
+            AttributeError: If the key does not exist.
         """
-        self.__delitem__(name)
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
 
+class OrderedDictObject(_AttributeAccess, OrderedDict):
+    """Ordered dictionary with attribute-style access.
 
-class DictObject(dict):
+    Extends ``collections.OrderedDict`` so that keys can be accessed,
+    set, and deleted as object attributes while preserving insertion
+    order.
+
+    Example:
+        >>> obj = OrderedDictObject([('a', 1), ('b', 2)])
+        >>> obj.a
+        1
+        >>> obj.c = 3
+        >>> list(obj.keys())
+        ['a', 'b', 'c']
+    """
+
+    __slots__ = ()
+
+
+class DictObject(_AttributeAccess, dict):
     """Dictionary with attribute-style access.
 
-    A simple ``dict`` subclass that maps its internal ``__dict__`` to
-    itself, allowing keys to be accessed as attributes.
+    A ``dict`` subclass that falls back to its keys for attributes it
+    does not otherwise have. Construction is plain ``dict`` construction,
+    with no per-instance setup.
 
     Used as ``object_pairs_hook`` for JSON and msgpack deserialization
     to provide convenient dot-notation access to response fields.
@@ -119,12 +126,4 @@ class DictObject(dict):
         'test'
     """
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the ``DictObject``.
-
-        Args:
-            *args: Positional arguments passed to ``dict``.
-            **kwargs: Keyword arguments passed to ``dict``.
-        """
-        dict.__init__(self, *args, **kwargs)
-        self.__dict__ = self
+    __slots__ = ()
@@ -30,19 +30,24 @@ The length encoding scheme uses a single byte for values below 255,
 and a variable-length encoding (7 bits per byte with continuation bit)
 for larger values.
 
-These utilities are compatible with the encoding used by the Xapian
-search engine library.
+All functions produce and consume ``bytes``, matching the binary wire
+format used by the Xapian search engine library. Text passed to the
+``serialise_*`` functions is encoded as UTF-8 once, at the boundary.
 """
 from __future__ import annotations
 
 __all__ = [
-    'serialise_length', 'unserialise_length',
+    'serialise_length', 'unserialise_length', 'unserialise_length_at',
     'serialise_string', 'unserialise_string',
     'serialise_char', 'unserialise_char',
+    'SerialiseWriter', 'SerialiseReader',
 ]
 
+# Encoded form of every single-byte length, shared instead of allocated per call.
+_LENGTH_BYTES = tuple(bytes((i,)) for i in range(255))
 
-def serialise_length(length: int) -> str:
+
+def serialise_length(length: int) -> bytes:
     """Serialize an integer length using Xapian's variable-length encoding.
 
     Values below 255 are encoded as a single byte. Values of 255 or
@@ -54,100 +59,143 @@ def serialise_length(length: int) -> str:
         length: Non-negative integer to encode.
 
     Returns:
-        str: The encoded length as a string of characters.
+        bytes: The encoded length.
 
     Example:
         >>> serialise_length(42)
-        '*'
+        b'*'
         >>> serialise_length(300)
-        '\\xff\\xad'
+        b'\\xff\\xad'
     """
-    if length < 255:
-        return chr(length)
-    result = chr(0xff)
+    if 0 <= length < 255:
+        return _LENGTH_BYTES[length]
     length -= 255
-    while True:
-        b = length & 0x7f
+    if length < 0x80:
+        return bytes((0xff, length | 0x80))
+    if length < 0x4000:
+        return bytes((0xff, length & 0x7f, (length >> 7) | 0x80))
+    result = bytearray(b'\xff')
+    while length >= 0x80:
+        result.append(length & 0x7f)
         length >>= 7
-        if not length:
-            result += chr(b | 0x80)
-            break
-        result += chr(b)
-    return result
+    result.append(length | 0x80)
+    return bytes(result)
 
 
-def unserialise_length(data: str, check_remaining: bool = False) -> tuple[int, str]:
-    """Deserialize a length from Xapian's variable-length encoding.
+def unserialise_length_at(data: bytes | bytearray | memoryview, offset: int = 0,
+                          check_remaining: bool = False) -> tuple[int, int]:
+    """Deserialize a length starting at ``offset`` without slicing ``data``.
 
-    Inverse of ``serialise_length``. Reads the encoded length from the
-    beginning of ``data`` and returns both the decoded length and the
-    remaining unconsumed data.
+    Offset-based variant of ``unserialise_length`` for loops decoding many
+    fields out of the same buffer: the caller keeps an integer cursor
+    instead of re-slicing the remaining data after every field.
 
     Args:
-        data: String containing the encoded length at the beginning.
+        data: Buffer containing the encoded length at ``offset``.
+        offset: Position of the encoded length within ``data``.
         check_remaining: If ``True``, raises ``ValueError`` when the
-            decoded length exceeds the remaining data size.
+            decoded length exceeds the data left after the length.
 
     Returns:
-        tuple[int, str]: A tuple of ``(length, remaining_data)`` where
-            ``length`` is the decoded integer and ``remaining_data``
-            is the unconsumed portion of the input.
+        tuple[int, int]: A tuple of ``(length, new_offset)`` where
+            ``new_offset`` points just past the encoded length.
 
     Raises:
-        ValueError: If the data is empty, the encoding is incomplete,
-            or ``check_remaining`` is ``True`` and the length exceeds
-            the remaining data.
+        ValueError: If there is no data at ``offset``, the encoding is
+            incomplete, or ``check_remaining`` is ``True`` and the length
+            exceeds the remaining data.
+
+    Example:
+        >>> unserialise_length_at(b'\\x03abc\\xff\\xad', 4)
+        (300, 6)
     """
-    if not data:
+    size = len(data)
+    if offset >= size:
         raise ValueError("Bad encoded length: no data")
-    length = ord(data[0])
+    length = data[offset]
+    offset += 1
     if length == 0xff:
         length = 0
         shift = 0
-        for i, ch in enumerate(data[1:], 1):
-            b = ord(ch)
+        while True:
+            if offset >= size:
+                raise ValueError("Bad encoded length: insufficient data")
+            b = data[offset]
+            offset += 1
             length |= (b & 0x7f) << shift
             shift += 7
             if b & 0x80:
                 break
-        else:
-            raise ValueError("Bad encoded length: insufficient data")
         length += 255
-        data = data[i + 1:]
-    else:
-        data = data[1:]
-    if check_remaining and length > len(data):
+    if check_remaining and length > size - offset:
         raise ValueError("Bad encoded length: length greater than data")
-    return length, data
+    return length, offset
+
+
+def unserialise_length(data: bytes | bytearray | memoryview,
+                       check_remaining: bool = False) -> tuple[int, memoryview]:
+    """Deserialize a length from Xapian's variable-length encoding.
+
+    Inverse of ``serialise_length``. Reads the encoded length from the
+    beginning of ``data`` and returns both the decoded length and the
+    remaining unconsumed data as a zero-copy ``memoryview``.
+
+    Args:
+        data: Buffer containing the encoded length at the beginning.
+        check_remaining: If ``True``, raises ``ValueError`` when the
+            decoded length exceeds the remaining data size.
+
+    Returns:
+        tuple[int, memoryview]: A tuple of ``(length, remaining_data)``
+            where ``length`` is the decoded integer and ``remaining_data``
+            is a view over the unconsumed portion of the input.
+
+    Raises:
+        ValueError: If the data is empty, the encoding is incomplete,
+            or ``check_remaining`` is ``True`` and the length exceeds
+            the remaining data.
+    """
+    length, offset = unserialise_length_at(data, 0, check_remaining)
+    return length, memoryview(data)[offset:]
 
 
-def serialise_string(s: str) -> str:
-    """Serialize a string by prepending its encoded length.
+def serialise_string(s: bytes | str) -> bytes:
+    """Serialize a byte string by prepending its encoded length.
 
     Encodes the string length using ``serialise_length`` and prepends
-    it to the string itself.
+    it to the string itself. A ``str`` is encoded as UTF-8 first, so its
+    length is counted in bytes.
 
     Args:
-        s: String to serialize.
+        s: Bytes (or text) to serialize.
 
     Returns:
-        str: The length-prefixed encoded string.
+        bytes: The length-prefixed encoded string.
+
+    Example:
+        >>> serialise_string('año')
+        b'\\x04a\\xc3\\xb1o'
     """
+    if s.__class__ is str:
+        s = s.encode('utf-8')
     return serialise_length(len(s)) + s
 
 
-def unserialise_string(data: str) -> tuple[str, str]:
-    """Deserialize a length-prefixed string.
+def unserialise_string(data: bytes | bytearray | memoryview) -> tuple[memoryview, memoryview]:
+    """Deserialize a length-prefixed byte string.
 
     Reads the encoded length from the beginning of ``data``, extracts
-    that many characters as the string, and returns the string along
-    with any remaining data.
+    that many bytes as the string, and returns the string along with
+    any remaining data. Both are ``memoryview`` slices over ``data``;
+    call ``.tobytes()`` (or ``.decode()`` on the bytes) where a copy is
+    actually needed.
 
     Args:
-        data: String containing a length-prefixed encoded string.
+        data: Buffer containing a length-prefixed encoded string.
 
     Returns:
-        tuple[str, str]: A tuple of ``(decoded_string, remaining_data)``.
+        tuple[memoryview, memoryview]: A tuple of
+            ``(decoded_string, remaining_data)``.
 
     Raises:
         ValueError: If the data is malformed or insufficient.
@@ -156,37 +204,40 @@ def unserialise_string(data: str) -> tuple[str, str]:
     return data[:length], data[length:]
 
 
-def serialise_char(c: str) -> str:
-    """Serialize a single character.
+def serialise_char(c: bytes | str) -> bytes:
+    """Serialize a single byte.
 
-    Validates that the input is exactly one character and returns it
-    unchanged.
+    Validates that the input is exactly one byte long and returns it
+    unchanged. A ``str`` is encoded as UTF-8 first, so only ASCII
+    characters are accepted.
 
     Args:
-        c: Single character string to serialize.
+        c: Single byte (or ASCII character) to serialize.
 
     Returns:
-        str: The character itself.
+        bytes: The byte itself.
 
     Raises:
-        ValueError: If ``c`` is not exactly one character long.
+        ValueError: If ``c`` is not exactly one byte long.
     """
+    if c.__class__ is str:
+        c = c.encode('utf-8')
     if len(c) != 1:
         raise ValueError("Serialisation error: Cannot serialise empty char")
     return c
 
 
-def unserialise_char(data: str) -> tuple[str, str]:
-    """Deserialize a single character from the beginning of data.
+def unserialise_char(data: bytes) -> tuple[bytes, bytes]:
+    """Deserialize a single byte from the beginning of data.
 
-    Extracts the first character and returns it along with the
-    remaining data.
+    Extracts the first byte and returns it along with the remaining
+    data.
 
     Args:
-        data: String to extract the first character from.
+        data: Bytes to extract the first byte from.
 
     Returns:
-        tuple[str, str]: A tuple of ``(character, remaining_data)``.
+        tuple[bytes, bytes]: A tuple of ``(char, remaining_data)``.
 
     Raises:
         ValueError: If ``data`` is empty.
@@ -194,3 +245,144 @@ def unserialise_char(data: str) -> tuple[str, str]:
     if len(data) < 1:
         raise ValueError("Bad encoded length: insufficient data")
     return data[:1], data[1:]
+
+
+class SerialiseWriter:
+    """Build a serialized message in a single growing buffer.
+
+    Appends each field in place to one ``bytearray`` instead of
+    concatenating ``serialise_*`` results, which copies the whole message
+    for every field added.
+
+    Example:
+        >>> writer = SerialiseWriter()
+        >>> writer.write_string(b'key')
+        >>> writer.write_length(300)
+        >>> writer.getvalue()
+        b'\\x03key\\xff\\xad'
+    """
+
+    __slots__ = ('buf',)
+
+    def __init__(self) -> None:
+        """Create a writer with an empty buffer."""
+        self.buf = bytearray()
+
+    def write_length(self, length: int) -> None:
+        """Append a length in Xapian's variable-length encoding.
+
+        Args:
+            length: Non-negative integer to encode.
+        """
+        self.buf += serialise_length(length)
+
+    def write_string(self, s: bytes | str) -> None:
+        """Append a length-prefixed string.
+
+        Args:
+            s: Bytes (or text, encoded as UTF-8) to append.
+        """
+        if s.__class__ is str:
+            s = s.encode('utf-8')
+        buf = self.buf
+        buf += serialise_length(len(s))
+        buf += s
+
+    def write_char(self, c: bytes | str) -> None:
+        """Append a single byte.
+
+        Args:
+            c: Single byte (or ASCII character) to append.
+
+        Raises:
+            ValueError: If ``c`` is not exactly one byte long.
+        """
+        self.buf += serialise_char(c)
+
+    def getvalue(self) -> bytes:
+        """Return the message written so far.
+
+        Returns:
+            bytes: A copy of the buffer contents.
+        """
+        return bytes(self.buf)
+
+
+class SerialiseReader:
+    """Read serialized fields from a buffer with an integer cursor.
+
+    Counterpart of ``SerialiseWriter``. Fields are returned as
+    ``memoryview`` slices of the original buffer and the cursor only
+    advances, so reading a message never copies it.
+
+    Args:
+        data: Buffer holding the serialized message.
+
+    Example:
+        >>> reader = SerialiseReader(b'\\x03key\\xff\\xad')
+        >>> reader.read_string().tobytes()
+        b'key'
+        >>> reader.read_length()
+        300
+    """
+
+    __slots__ = ('data', 'offset')
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        """Create a reader positioned at the start of ``data``.
+
+        Args:
+            data: Buffer holding the serialized message. It is wrapped in a
+                ``memoryview`` (not copied) and read from offset 0.
+        """
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def read_length(self) -> int:
+        """Read a length and advance past it.
+
+        Returns:
+            int: The decoded length.
+
+        Raises:
+            ValueError: If the data is exhausted or the encoding is
+                incomplete.
+        """
+        length, self.offset = unserialise_length_at(self.data, self.offset)
+        return length
+
+    def read_string(self) -> memoryview:
+        """Read a length-prefixed string and advance past it.
+
+        Returns:
+            memoryview: A view over the string's bytes.
+
+        Raises:
+            ValueError: If the data is malformed or insufficient.
+        """
+        length, offset = unserialise_length_at(self.data, self.offset, True)
+        self.offset = end = offset + length
+        return self.data[offset:end]
+
+    def read_char(self) -> bytes:
+        """Read a single byte and advance past it.
+
+        Returns:
+            bytes: The byte read.
+
+        Raises:
+            ValueError: If the data is exhausted.
+        """
+        offset = self.offset
+        if offset >= len(self.data):
+            raise ValueError("Bad encoded length: insufficient data")
+        self.offset = offset + 1
+        return self.data[offset:offset + 1].tobytes()
+
+    def remaining(self) -> memoryview:
+        """Return the unread part of the buffer.
+
+        Returns:
+            memoryview: A view over the bytes after the cursor.
+        """
+        return self.data[self.offset:]
@@ -1,14 +1,26 @@
 """Tests for xapiand — NotFoundError and Xapiand async client."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import copy
 import json
+import sys
+import threading
+import weakref
 from datetime import datetime, date, time
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch, mock_open
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from xapiand import (
     NA,
     Xapiand,
@@ -18,18 +30,58 @@ from xapiand import (
     XAPIAND_HOST,
     XAPIAND_PORT,
     XAPIAND_PREFIX,
+    XAPIAND_MAX_CONNECTIONS,
+    XAPIAND_KEEPALIVE_EXPIRY,
+    DEFAULT_ACCEPT_ENCODING,
     _serialize_default,
     _deserialize_value,
     _deserialize_object_pairs_hook,
+    _json_dumps,
+    _content_kind,
+    _CT_JSON,
+    _CT_MSGPACK,
+    _CT_OTHER,
+    _normalize_params,
+    _prefix_path,
+    _cached_url,
+    UPLOAD_CHUNK_SIZE,
+    _index_paths,
 )
 from xapiand.collections import DictObject
 
 
 # ── helpers ──────────────────────────────────────────────────────────────────────────────────────────────────────
 
+_REQUEST = httpx.Request('GET', 'http://localhost:8880/')
+
+
+class _FakeResponse:
+    """Minimal stand-in for httpx.Response exposing what _send_request reads."""
+
+    __slots__ = ('status_code', 'content', 'headers', 'raise_for_status')
+
+
+def _ok():
+    """No-op ``raise_for_status`` for successful fake responses."""
+
+
+def _raise_status(resp):
+    """Build a ``raise_for_status`` that raises httpx.HTTPStatusError for ``resp``.
+
+    Args:
+        resp: The fake response the error refers to.
+
+    Returns:
+        A callable raising httpx.HTTPStatusError.
+    """
+    def raise_for_status():
+        raise httpx.HTTPStatusError("error", request=_REQUEST, response=resp)
+    return raise_for_status
+
+
 def _mock_response(status_code=200, content=b'{}', content_type='application/json',
                    headers=None):
-    """Create a mock httpx.Response for testing.
+    """Create a fake httpx.Response for testing.
 
     Args:
         status_code: HTTP status code for the response.
@@ -38,18 +90,17 @@ def _mock_response(status_code=200, content=b'{}', content_type='application/jso
         headers: Additional headers to merge into the response.
 
     Returns:
-        A MagicMock spec'd to httpx.Response with the given attributes.
+        A _FakeResponse with the given attributes. ``raise_for_status``
+        raises httpx.HTTPStatusError for error codes other than 404.
     """
-    resp = MagicMock(spec=httpx.Response)
+    resp = _FakeResponse()
     resp.status_code = status_code
     resp.content = content
-    resp.headers = {'content-type': content_type}
-    if headers:
-        resp.headers.update(headers)
-    resp.raise_for_status = MagicMock()
+    resp.headers = {'content-type': content_type, **(headers or {})}
     if status_code >= 400 and status_code != 404:
-        resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "error", request=MagicMock(), response=resp)
+        resp.raise_for_status = _raise_status(resp)
+    else:
+        resp.raise_for_status = _ok
     return resp
 
 
@@ -62,9 +113,124 @@ def _json_content(data):
     Returns:
         UTF-8 encoded JSON bytes.
     """
+    if orjson is not None:
+        return orjson.dumps(data)
     return json.dumps(data).encode()
 
 
+def _load_json(content):
+    """Decode a JSON request body sent by the client.
+
+    Args:
+        content: JSON document as bytes or str.
+
+    Returns:
+        The decoded Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@contextlib.contextmanager
+def fast_patch(obj, name, value):
+    """Shadow an attribute of ``obj`` with ``value`` for the duration of a block.
+
+    A lighter ``patch.object`` for instance methods: the value is set in the
+    instance ``__dict__`` and removed on exit, uncovering the class attribute.
+
+    Args:
+        obj: The instance to patch.
+        name: The attribute name.
+        value: The replacement, usually an ``AsyncMock``.
+
+    Yields:
+        ``value``.
+    """
+    setattr(obj, name, value)
+    try:
+        yield value
+    finally:
+        obj.__dict__.pop(name, None)
+
+
+@pytest.fixture
+def mock_msgpack(monkeypatch):
+    """Replace ``xapiand.msgpack`` with a mock whose packer encodes to ``b'\\x80'``.
+
+    Returns:
+        The MagicMock installed as ``xapiand.msgpack``.
+    """
+    mock = MagicMock()
+    mock.Packer.return_value.pack.return_value = b'\x80'
+    monkeypatch.setattr('xapiand.msgpack', mock)
+    return mock
+
+
+@pytest.fixture
+def patch_session(monkeypatch):
+    """Factory installing a stub session on a client for the duration of a test.
+
+    The stub is set in the instance ``__dict__`` (shadowing the per-loop
+    session descriptor) and removed by ``monkeypatch`` on teardown.
+
+    Returns:
+        A callable ``(client, response)`` returning the AsyncMock bound to
+        ``session.request``.
+    """
+    def _make(client, response):
+        request = AsyncMock(return_value=response)
+        monkeypatch.setitem(client.__dict__, 'session', SimpleNamespace(request=request))
+        return request
+    return _make
+
+
+@pytest.fixture(scope='module')
+def api_client():
+    """Client shared by API method tests that only patch ``_send_request``."""
+    return Xapiand(host='localhost', port=8880, commit=False, prefix=None,
+                   default_accept='application/json')
+
+
+@pytest.fixture
+def client(api_client):
+    """Shallow copy of ``api_client`` for tests that modify or stub the client.
+
+    Copying skips the constructor; the copy gets its own session cache and
+    thread-local state, so sessions and packers are never shared between tests.
+    """
+    client = copy.copy(api_client)
+    client._sessions = weakref.WeakKeyDictionary()
+    client._local = threading.local()
+    client._unbound_session = None
+    return client
+
+
+# Canned response bodies shared by many tests, encoded once.
+_EMPTY_JSON = _json_content({})
+_OK_JSON = _json_content({"ok": True})
+_KV_JSON = _json_content({"key": "value"})
+_SEARCH_JSON = (
+    b'{"#query": {"#hits": [{"id": 1}], "#total_count": 100, "#matches_estimated": 150},'
+    b' "#aggregations": {"field": {"count": 10}}}'
+)
+
+# Decimal and date/time values shared by the (de)serialization tests.
+_DEC_19_99 = Decimal('19.99')
+_DEC_9_99 = Decimal('9.99')
+_DEC_5_50 = Decimal('5.50')
+_DT_20250615 = datetime(2025, 6, 15, 12, 30, 45)
+_D_20250615 = date(2025, 6, 15)
+_T_123045 = time(12, 30, 45)
+
+# Actions whose 404 maps to NotFoundError (or the caller's default), with a matching body.
+_NOT_FOUND_CASES = [
+    ('get', None),
+    ('patch', {'a': 1}),
+    ('merge', {'a': 1}),
+    ('delete', None),
+]
+
 # ── NotFoundError ────────────────────────────────────────────────────────────────────────────────────────────
 
 class TestNotFoundError:
@@ -100,7 +266,8 @@ class TestXapiandInit:
         assert c.host == XAPIAND_HOST
         assert c.port == XAPIAND_PORT
         assert c.commit == XAPIAND_COMMIT
-        assert c.default_accept_encoding == 'deflate, gzip, identity'
+        assert c.default_accept_encoding == DEFAULT_ACCEPT_ENCODING
+        assert DEFAULT_ACCEPT_ENCODING.endswith('deflate, gzip, identity')
 
     def test_explicit_params(self):
         c = Xapiand(host='myhost', port=9999, commit=True, prefix='pre')
@@ -147,6 +314,103 @@ class TestXapiandInit:
     def test_na_sentinel(self):
         assert Xapiand.NA is NA
 
+    def test_session_per_instance(self):
+        a = Xapiand()
+        b = Xapiand()
+        assert isinstance(a.session, httpx.AsyncClient)
+        assert a.session is not b.session
+
+    def test_session_keep_alive_header(self):
+        c = Xapiand()
+        assert c.session.headers['connection'] == 'keep-alive'
+
+    def test_session_pool_limits(self):
+        c = Xapiand(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30)
+        with patch('xapiand.httpx.AsyncClient') as m:
+            c.session
+        assert m.call_args.kwargs['limits'] == httpx.Limits(
+            max_connections=10, max_keepalive_connections=5, keepalive_expiry=30)
+
+    def test_session_default_pool_limits(self):
+        c = Xapiand()
+        with patch('xapiand.httpx.AsyncClient') as m:
+            c.session
+        assert m.call_args.kwargs['limits'] == httpx.Limits(
+            max_connections=XAPIAND_MAX_CONNECTIONS,
+            max_keepalive_connections=200,
+            keepalive_expiry=XAPIAND_KEEPALIVE_EXPIRY,
+        )
+
+    def test_session_pool_limits_class_defaults(self):
+        class TunedXapiand(Xapiand):
+            """Subclass overriding the connection pool defaults."""
+
+            DEFAULT_MAX_CONNECTIONS = 50
+            DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+            DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+        c = TunedXapiand()
+        with patch('xapiand.httpx.AsyncClient') as m:
+            c.session
+        assert m.call_args.kwargs['limits'] == httpx.Limits(
+            max_connections=50, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+    def test_http1_by_default(self):
+        c = Xapiand()
+        with patch('xapiand.httpx.AsyncClient') as m:
+            c.session
+        assert m.call_args.kwargs['http1'] is True
+        assert m.call_args.kwargs['http2'] is False
+
+    def test_http2_session(self):
+        pytest.importorskip('h2')
+        c = Xapiand(http2=True)
+        with patch('xapiand.httpx.AsyncClient') as m:
+            c.session
+        assert m.call_args.kwargs['http1'] is False
+        assert m.call_args.kwargs['http2'] is True
+
+    def test_http2_from_environment(self):
+        with patch('xapiand.XAPIAND_HTTP2', True), patch('xapiand.h2', object()):
+            assert Xapiand().http2 is True
+        assert Xapiand(http2=False).http2 is False
+
+    def test_http2_requires_h2(self):
+        with patch('xapiand.h2', None):
+            with pytest.raises(ImportError, match='h2'):
+                Xapiand(http2=True)
+
+    def test_session_created_lazily(self):
+        with patch('xapiand.httpx.AsyncClient') as m:
+            Xapiand()
+        m.assert_not_called()
+
+    async def test_session_reused_within_loop(self):
+        c = Xapiand()
+        assert c.session is c.session
+
+    def test_session_per_event_loop(self):
+        c = Xapiand()
+
+        async def get_session():
+            return c.session
+
+        assert asyncio.run(get_session()) is not asyncio.run(get_session())
+
+    async def test_closed_session_replaced(self):
+        c = Xapiand()
+        session = c.session
+        await session.aclose()
+        assert c.session is not session
+
+    def test_assigned_session_takes_precedence(self):
+        c = Xapiand()
+        mock = MagicMock()
+        c.session = mock
+        assert c.session is mock
+        del c.session
+        assert isinstance(c.session, httpx.AsyncClient)
+
 
 # ── Xapiand._build_url ──────────────────────────────────────────────────────────────────────────────────────
 
@@ -173,6 +437,10 @@ class TestBuildUrl:
         url = self.client._build_url('get', 'idx', 'other', 9999, None, 'id1')
         assert url == 'http://other:9999/default/idx/id1'
 
+    def test_custom_port_only(self):
+        url = self.client._build_url('get', 'idx', None, 9999, None, 'id1')
+        assert url == 'http://localhost:9999/default/idx/id1'
+
     def test_host_with_colon_port(self):
         url = self.client._build_url('get', 'idx', 'h:7777', None, None, 'id1')
         assert url == 'http://h:7777/default/idx/id1'
@@ -198,6 +466,10 @@ class TestBuildUrl:
         assert 'default/a/' in url
         assert 'default/b/' in url
 
+    def test_comma_separated_index_keeps_order(self):
+        url = self.client._build_url('get', 'b,/a/,b,a', None, None, None, None)
+        assert url == 'http://localhost:8880/default/b/,default/a/'
+
     def test_no_prefix(self):
         c = Xapiand(host='localhost', port=8880, prefix=None)
         url = c._build_url('get', 'idx', None, None, None, 'doc')
@@ -207,16 +479,44 @@ class TestBuildUrl:
         url = self.client._build_url('get', 'idx', '', '', None, None)
         assert url == 'http://localhost:8880/default/idx/'
 
+    def test_single_index_strips_slashes(self):
+        url = self.client._build_url('get', '/idx/', None, None, None, 'doc')
+        assert url == 'http://localhost:8880/default/idx/doc'
+
+    def test_duplicate_comma_separated_index(self):
+        url = self.client._build_url('search', 'idx,idx', None, None, None, None)
+        assert url == 'http://localhost:8880/default/idx/:search'
+
+    def test_repeated_url_is_cached(self):
+        _cached_url.cache_clear()
+        first = self.client._build_url('get', ['idx2', 'idx1'], None, None, None, 'doc')
+        second = self.client._build_url('get', ('idx1', 'idx2'), None, None, None, 'doc')
+        assert first == second
+        assert _cached_url.cache_info().hits == 1
+
+    def test_index_paths_shared_across_ids(self):
+        _cached_url.cache_clear()
+        _index_paths.cache_clear()
+        self.client._build_url('get', 'idx', None, None, None, 'doc1')
+        url = self.client._build_url('get', 'idx', None, None, None, 'doc2')
+        assert url == 'http://localhost:8880/default/idx/doc2'
+        assert _index_paths.cache_info().hits == 1
+
 
 # ── Xapiand._send_request ────────────────────────────────────────────────────────────────────────────────────
 
 class TestSendRequest:
     """Tests for Xapiand._send_request HTTP dispatch and response handling."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
+
+    @pytest.fixture(autouse=True)
+    def _bind_patch_session(self, patch_session):
+        """Make the ``patch_session`` factory available to the tests."""
+        self._patch_session = patch_session
 
     def _patch_method(self, action, response):
         """Replace the client session with a mock that returns a canned response.
@@ -228,14 +528,7 @@ class TestSendRequest:
         Returns:
             The AsyncMock bound to ``session.request``.
         """
-        mock_session = MagicMock()
-        mock_session.request = AsyncMock(return_value=response)
-        self.client.session = mock_session
-        return mock_session.request
-
-    def teardown_method(self):
-        """Remove the per-instance session mock so the class attribute is restored."""
-        self.client.__dict__.pop('session', None)
+        return self._patch_session(self.client, response)
 
     async def test_basic_get_json(self):
         resp = _mock_response(content=_json_content({"title": "hello"}))
@@ -244,40 +537,21 @@ class TestSendRequest:
         assert result['title'] == 'hello'
         method.assert_called_once()
 
-    async def test_404_with_default(self):
-        resp = _mock_response(status_code=404)
-        self._patch_method('get', resp)
-        result = await self.client._send_request('get', 'idx', id='doc1', default=None)
-        assert result is None
-
-    async def test_404_without_default_raises(self):
-        resp = _mock_response(status_code=404)
-        self._patch_method('get', resp)
-        with pytest.raises(NotFoundError):
-            await self.client._send_request('get', 'idx', id='doc1')
-
-    async def test_404_on_patch(self):
-        resp = _mock_response(status_code=404)
-        self._patch_method('patch', resp)
+    @pytest.mark.parametrize('action, body', _NOT_FOUND_CASES)
+    async def test_404_without_default_raises(self, action, body):
+        self._patch_method(action, _mock_response(status_code=404))
         with pytest.raises(NotFoundError):
-            await self.client._send_request('patch', 'idx', id='doc1', body={'a': 1})
+            await self.client._send_request(action, 'idx', id='doc1', body=body)
 
-    async def test_404_on_merge(self):
-        resp = _mock_response(status_code=404)
-        self._patch_method('merge', resp)
-        with pytest.raises(NotFoundError):
-            await self.client._send_request('merge', 'idx', id='doc1', body={'a': 1})
-
-    async def test_404_on_delete(self):
-        resp = _mock_response(status_code=404)
-        self._patch_method('delete', resp)
-        with pytest.raises(NotFoundError):
-            await self.client._send_request('delete', 'idx', id='doc1')
+    @pytest.mark.parametrize('action, body', _NOT_FOUND_CASES)
+    async def test_404_with_default(self, action, body):
+        self._patch_method(action, _mock_response(status_code=404))
+        result = await self.client._send_request(action, 'idx', id='doc1', body=body, default=None)
+        assert result is None
 
     async def test_404_on_post_raises_http_status_error(self):
         resp = _mock_response(status_code=404)
-        resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "error", request=MagicMock(), response=resp)
+        resp.raise_for_status = _raise_status(resp)
         self._patch_method('post', resp)
         with pytest.raises(httpx.HTTPStatusError):
             await self.client._send_request('post', 'idx', body={'a': 1})
@@ -288,16 +562,46 @@ class TestSendRequest:
         with pytest.raises(httpx.HTTPStatusError):
             await self.client._send_request('get', 'idx', id='doc1')
 
+    async def test_default_headers_sent(self):
+        resp = _mock_response(content=_EMPTY_JSON)
+        method = self._patch_method('get', resp)
+        await self.client._send_request('get', 'idx', id='doc')
+        headers = method.call_args.kwargs['headers']
+        assert headers['accept'] == 'application/json'
+        assert headers['accept-encoding'] == DEFAULT_ACCEPT_ENCODING
+
+    async def test_caller_headers_not_mutated(self):
+        resp = _mock_response(content=_EMPTY_JSON)
+        method = self._patch_method('get', resp)
+        caller_headers = {'accept': 'text/plain'}
+        await self.client._send_request('get', 'idx', id='doc', headers=caller_headers)
+        assert caller_headers == {'accept': 'text/plain'}
+        assert method.call_args.kwargs['headers']['accept'] == 'text/plain'
+
+    async def test_default_headers_not_copied_or_mutated(self):
+        resp = _mock_response(content=_EMPTY_JSON)
+        method = self._patch_method('get', resp)
+        defaults = dict(self.client._default_headers)
+        await self.client._send_request('get', 'idx', id='doc')
+        assert method.call_args.kwargs['headers'] is self.client._default_headers
+        await self.client._send_request('post', 'idx', json={'a': 1})
+        assert self.client._default_headers == defaults
+
+    async def test_caller_accept_sets_content_type(self):
+        resp = _mock_response(content=_EMPTY_JSON)
+        method = self._patch_method('post', resp)
+        await self.client._send_request('post', 'idx', body={'a': 1}, headers={'accept': 'application/x-msgpack'})
+        assert method.call_args.kwargs['headers']['content-type'] == 'application/x-msgpack'
+
+    async def test_default_accept_change_applies(self):
+        resp = _mock_response(content=_EMPTY_JSON)
+        method = self._patch_method('get', resp)
+        self.client.default_accept = 'text/plain'
+        await self.client._send_request('get', 'idx', id='doc')
+        assert method.call_args.kwargs['headers']['accept'] == 'text/plain'
+
     async def test_search_response_restructuring(self):
-        data = {
-            '#query': {
-                '#hits': [{'id': 1}],
-                '#total_count': 100,
-                '#matches_estimated': 150,
-            },
-            '#aggregations': {'field': {'count': 10}},
-        }
-        resp = _mock_response(content=_json_content(data))
+        resp = _mock_response(content=_SEARCH_JSON)
         self._patch_method('search', resp)
         result = await self.client._send_request('search', 'idx')
         assert result['hits'] == [{'id': 1}]
@@ -306,90 +610,182 @@ class TestSendRequest:
         assert result['aggregations'] == {'field': {'count': 10}}
 
     async def test_search_no_query_key(self):
-        resp = _mock_response(content=_json_content({"key": "value"}))
+        resp = _mock_response(content=_KV_JSON)
         self._patch_method('search', resp)
         result = await self.client._send_request('search', 'idx')
         assert result['key'] == 'value'
 
     async def test_search_with_body_uses_post(self):
-        resp = _mock_response(content=_json_content({"key": "value"}))
+        resp = _mock_response(content=_KV_JSON)
         method = self._patch_method('search', resp)
         await self.client._send_request('search', 'idx', body={'query': 'test'})
         method.assert_called_once()
         # When search has a body, it should use POST
         assert method.call_args[0][0] == 'POST'
 
+    async def test_multi_index_search_single_request(self):
+        resp = _mock_response(content=_KV_JSON)
+        method = self._patch_method('search', resp)
+        await self.client.search(['idx2', 'idx1'], query='test')
+        method.assert_called_once()
+        url = method.call_args[0][1]
+        assert url == 'http://localhost:8880/idx1/,idx2/:search'
+
     async def test_json_kwarg(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method('post', resp)
         await self.client._send_request('post', 'idx', json={'data': 1})
         call_kwargs = method.call_args
         assert 'json' not in call_kwargs.kwargs
 
-    async def test_msgpack_kwarg(self):
-        mock_msgpack = MagicMock()
-        mock_msgpack.dumps.return_value = b'\x81\xa1k\xa1v'
-        resp = _mock_response(content=_json_content({"ok": True}))
+    async def test_msgpack_kwarg(self, mock_msgpack):
+        mock_msgpack.Packer.return_value.pack.return_value = b'\x81\xa1k\xa1v'
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method('post', resp)
-        with patch('xapiand.msgpack', mock_msgpack):
-            await self.client._send_request('post', 'idx', msgpack={'data': 1})
+        await self.client._send_request('post', 'idx', msgpack={'data': 1})
         call_kwargs = method.call_args
         assert 'msgpack' not in call_kwargs.kwargs
 
     async def test_body_dict_json_serialization(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method('post', resp)
         await self.client._send_request('post', 'idx', body={'key': 'val'})
         call_kwargs = method.call_args.kwargs
         body_sent = call_kwargs['content']
-        assert json.loads(body_sent) == {'key': 'val'}
+        assert _load_json(body_sent) == {'key': 'val'}
 
     async def test_body_list_json_serialization(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method('post', resp)
         await self.client._send_request('post', 'idx', body=[1, 2, 3])
         call_kwargs = method.call_args.kwargs
         body_sent = call_kwargs['content']
-        assert json.loads(body_sent) == [1, 2, 3]
+        assert _load_json(body_sent) == [1, 2, 3]
 
-    async def test_body_dict_msgpack_serialization(self):
-        mock_msgpack = MagicMock()
-        mock_msgpack.dumps.return_value = b'\x80'
-        resp = _mock_response(content=_json_content({"ok": True}))
+    async def test_body_dict_msgpack_serialization(self, mock_msgpack):
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method('post', resp)
-        c = Xapiand(host='localhost', port=8880, prefix=None,
-                     default_accept='application/x-msgpack')
-        c.session = self.client.session
-        with patch('xapiand.msgpack', mock_msgpack):
-            await c._send_request('post', 'idx', body={'key': 'val'})
-        mock_msgpack.dumps.assert_called_once_with({'key': 'val'}, default=_serialize_default)
+        self.client.default_accept = 'application/x-msgpack'
+        await self.client._send_request('post', 'idx', body={'key': 'val'})
+        mock_msgpack.Packer.assert_called_once_with(default=_serialize_default)
+        mock_msgpack.Packer.return_value.pack.assert_called_once_with({'key': 'val'})
+
+    def test_msgpack_packer_per_thread(self):
+        msgpack = pytest.importorskip('msgpack')
+        sent = []
+
+        async def request(method, url, content=None, **kwargs):
+            """Record the encoded body."""
+            sent.append(content)
+            return _mock_response(content=_OK_JSON)
+
+        self.client.__dict__['session'] = SimpleNamespace(request=request)
+        self.client.default_accept = 'application/x-msgpack'
+
+        async def run(thread):
+            """Send msgpack bodies with Decimal and datetime values."""
+            for i in range(200):
+                body = {'thread': thread, 'i': i, 'at': _DT_20250615, 'prices': [_DEC_19_99] * 32, 'fill': [thread] * 64}
+                await self.client._send_request('put', 'idx', id=f'{thread}-{i}', body=body)
+
+        threads = [threading.Thread(target=asyncio.run, args=(run(t),)) for t in range(4)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads inside pack() as often as possible
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
 
-    async def test_body_file_path(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
-        self._patch_method('post', resp)
-        m = mock_open(read_data='file content')
-        with patch('os.path.isfile', return_value=True), patch('builtins.open', m):
-            await self.client._send_request('post', 'idx', body='/path/to/file.json')
-        m.assert_called_once_with('/path/to/file.json', 'r')
+        assert len(sent) == 800
+        for content in sent:
+            body = msgpack.unpackb(content)
+            assert body['prices'] == [19.99] * 32
+            assert body['at'] == '2025-06-15T12:30:45'
+            assert body['fill'] == [body['thread']] * 64
+
+    def test_encoders_without_msgpack(self):
+        with patch('xapiand.msgpack', None):
+            c = Xapiand(host='localhost', port=8880, prefix=None)
+            assert c._encoders == {_CT_JSON: _json_dumps}
+
+    async def test_body_bytes_sent_unchanged(self):
+        resp = _mock_response(content=_OK_JSON)
+        method = self._patch_method('post', resp)
+        with patch('os.path.isfile') as isfile:
+            await self.client._send_request('post', 'idx', body=b'\x81\xa1k\xa1v')
+        isfile.assert_not_called()
+        assert method.call_args.kwargs['content'] == b'\x81\xa1k\xa1v'
+
+    @pytest.mark.parametrize('body', [bytearray(b'\x81\xa1k\xa1v'), memoryview(b'\x81\xa1k\xa1v')])
+    async def test_body_bytes_like_sent_as_bytes(self, body):
+        resp = _mock_response(content=_OK_JSON)
+        method = self._patch_method('post', resp)
+        await self.client._send_request('post', 'idx', body=body)
+        content = method.call_args.kwargs['content']
+        assert type(content) is bytes
+        assert content == b'\x81\xa1k\xa1v'
+
+    async def test_body_file_path(self, tmp_path):
+        path = tmp_path / 'file.bin'
+        path.write_bytes(b'\x00\xff' * 50000)
+        resp = _mock_response(content=_OK_JSON)
+        method = self._patch_method('post', resp)
+        await self.client._send_request('post', 'idx', body=str(path))
+        call_kwargs = method.call_args.kwargs
+        assert call_kwargs['headers']['content-length'] == '100000'
+        assert b''.join([chunk async for chunk in call_kwargs['content']]) == b'\x00\xff' * 50000
+
+    async def test_body_file_streamed_in_chunks(self, tmp_path):
+        path = tmp_path / 'file.bin'
+        path.write_bytes(b'x' * 100000)
+        resp = _mock_response(content=_OK_JSON)
+        method = self._patch_method('post', resp)
+        await self.client._send_request('post', 'idx', body=str(path))
+        chunks = [chunk async for chunk in method.call_args.kwargs['content']]
+        assert [len(c) for c in chunks] == [UPLOAD_CHUNK_SIZE, 100000 - UPLOAD_CHUNK_SIZE]
+
+    async def test_body_file_does_not_touch_default_headers(self, tmp_path):
+        path = tmp_path / 'file.bin'
+        path.write_bytes(b'data')
+        self._patch_method('post', _mock_response(content=_OK_JSON))
+        await self.client._send_request('post', 'idx', body=str(path))
+        assert 'content-length' not in self.client._default_headers
+
+    async def test_body_pathlike_skips_isfile(self, tmp_path):
+        path = tmp_path / 'file.json'
+        path.write_bytes(b'{}')
+        resp = _mock_response(content=_OK_JSON)
+        method = self._patch_method('post', resp)
+        with patch('os.path.isfile') as isfile:
+            await self.client._send_request('post', 'idx', body=path)
+        isfile.assert_not_called()
+        assert b''.join([chunk async for chunk in method.call_args.kwargs['content']]) == b'{}'
+
+    async def test_body_long_string_skips_isfile(self):
+        resp = _mock_response(content=_OK_JSON)
+        method = self._patch_method('post', resp)
+        body = 'x' * 5000
+        with patch('os.path.isfile') as isfile:
+            await self.client._send_request('post', 'idx', body=body)
+        isfile.assert_not_called()
+        assert method.call_args.kwargs['content'] == body
 
     async def test_no_body_with_data_kwarg_json(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method('post', resp)
         await self.client._send_request('post', 'idx', data={'k': 'v'})
         call_kwargs = method.call_args.kwargs
-        assert call_kwargs['content'] == json.dumps({'k': 'v'}, ensure_ascii=True)
+        assert _load_json(call_kwargs['content']) == {'k': 'v'}
 
-    async def test_no_body_with_data_kwarg_msgpack(self):
-        mock_msgpack = MagicMock()
-        mock_msgpack.dumps.return_value = b'\x80'
-        resp = _mock_response(content=_json_content({"ok": True}))
+    async def test_no_body_with_data_kwarg_msgpack(self, mock_msgpack):
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method('post', resp)
-        c = Xapiand(host='localhost', port=8880, prefix=None,
-                     default_accept='application/x-msgpack')
-        c.session = self.client.session
-        with patch('xapiand.msgpack', mock_msgpack):
-            await c._send_request('post', 'idx', data={'k': 'v'})
-        mock_msgpack.dumps.assert_called_once_with({'k': 'v'}, default=_serialize_default)
+        self.client.default_accept = 'application/x-msgpack'
+        await self.client._send_request('post', 'idx', data={'k': 'v'})
+        mock_msgpack.Packer.return_value.pack.assert_called_once_with({'k': 'v'})
 
     async def test_response_unknown_content_type(self):
         resp = _mock_response(content=b'raw bytes', content_type='application/octet-stream')
@@ -397,18 +793,16 @@ class TestSendRequest:
         result = await self.client._send_request('get', 'idx', id='doc1')
         assert result == b'raw bytes'
 
-    async def test_response_msgpack_deserialization(self):
-        mock_msgpack = MagicMock()
+    async def test_response_msgpack_deserialization(self, mock_msgpack):
         mock_msgpack.loads.return_value = DictObject(title='hello')
         resp = _mock_response(content=b'\x80', content_type='application/x-msgpack')
         self._patch_method('get', resp)
-        with patch('xapiand.msgpack', mock_msgpack):
-            result = await self.client._send_request('get', 'idx', id='doc1')
+        result = await self.client._send_request('get', 'idx', id='doc1')
         mock_msgpack.loads.assert_called_once_with(b'\x80', object_pairs_hook=_deserialize_object_pairs_hook)
         assert result['title'] == 'hello'
 
     async def test_params_bool_conversion(self):
-        resp = _mock_response(content=_json_content({}))
+        resp = _mock_response(content=_EMPTY_JSON)
         method = self._patch_method('get', resp)
         await self.client._send_request('get', 'idx', id='doc',
                                   params={'pretty': True, 'volatile': True})
@@ -417,7 +811,7 @@ class TestSendRequest:
         assert call_kwargs['params']['volatile'] == 1
 
     async def test_params_falsy_special_keys_excluded(self):
-        resp = _mock_response(content=_json_content({}))
+        resp = _mock_response(content=_EMPTY_JSON)
         method = self._patch_method('get', resp)
         await self.client._send_request('get', 'idx', id='doc',
                                   params={'pretty': False, 'volatile': False,
@@ -430,7 +824,7 @@ class TestSendRequest:
         assert 'indent' not in call_kwargs['params']
 
     async def test_params_double_underscore_conversion(self):
-        resp = _mock_response(content=_json_content({}))
+        resp = _mock_response(content=_EMPTY_JSON)
         method = self._patch_method('get', resp)
         await self.client._send_request('get', 'idx', id='doc',
                                   params={'some__nested': 'val'})
@@ -438,7 +832,7 @@ class TestSendRequest:
         assert 'some.nested' in call_kwargs['params']
 
     async def test_params_commit_false_excluded(self):
-        resp = _mock_response(content=_json_content({}))
+        resp = _mock_response(content=_EMPTY_JSON)
         method = self._patch_method('post', resp)
         await self.client._send_request('post', 'idx', body={'a': 1},
                                   params={'commit': False, 'other': 'x'})
@@ -446,7 +840,7 @@ class TestSendRequest:
         assert 'commit' not in call_kwargs['params']
 
     async def test_no_follow_redirects_in_kwargs(self):
-        resp = _mock_response(content=_json_content({}))
+        resp = _mock_response(content=_EMPTY_JSON)
         method = self._patch_method('get', resp)
         await self.client._send_request('get', 'idx', id='doc')
         call_kwargs = method.call_args.kwargs
@@ -454,7 +848,7 @@ class TestSendRequest:
         assert 'follow_redirects' not in call_kwargs
 
     async def test_schema_handling_dict_schema(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method('post', resp)
         c = Xapiand(host='localhost', port=8880, prefix='pre',
                      default_accept='application/json')
@@ -463,11 +857,11 @@ class TestSendRequest:
         await c._send_request('post', 'idx', body=body)
         method = c.session.request
         call_kwargs = method.call_args.kwargs
-        sent_body = json.loads(call_kwargs['content'])
+        sent_body = _load_json(call_kwargs['content'])
         assert sent_body['_schema']['_foreign'] == 'pre/some/path'
 
     async def test_schema_handling_string_schema(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method('post', resp)
         c = Xapiand(host='localhost', port=8880, prefix='pre',
                      default_accept='application/json')
@@ -476,11 +870,35 @@ class TestSendRequest:
         await c._send_request('post', 'idx', body=body)
         method = c.session.request
         call_kwargs = method.call_args.kwargs
-        sent_body = json.loads(call_kwargs['content'])
+        sent_body = _load_json(call_kwargs['content'])
         assert sent_body['_schema'] == 'pre/schema/path'
 
+    async def test_schema_caller_body_not_mutated(self):
+        resp = _mock_response(content=_OK_JSON)
+        self._patch_method('post', resp)
+        c = Xapiand(host='localhost', port=8880, prefix='pre',
+                     default_accept='application/json')
+        c.session = self.client.session
+        body = {'_schema': {'_foreign': '/some/path'}, 'data': 1}
+        await c._send_request('post', 'idx', body=body)
+        await c._send_request('post', 'idx', body=body)
+        assert body == {'_schema': {'_foreign': '/some/path'}, 'data': 1}
+        sent_body = _load_json(c.session.request.call_args.kwargs['content'])
+        assert sent_body['_schema']['_foreign'] == 'pre/some/path'
+
+    async def test_schema_already_prefixed_not_copied(self):
+        resp = _mock_response(content=_OK_JSON)
+        self._patch_method('post', resp)
+        c = Xapiand(host='localhost', port=8880, prefix='pre',
+                     default_accept='application/json')
+        c.session = self.client.session
+        body = {'_schema': 'pre/schema/path', 'data': 1}
+        with patch('xapiand._json_dumps', wraps=_json_dumps) as dumps:
+            await c._send_request('post', 'idx', body=body)
+        assert dumps.call_args.args[0] is body
+
     async def test_debug_logging_body(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method('post', resp)
         with patch('xapiand.logger') as mock_logger:
             mock_logger.isEnabledFor.return_value = True
@@ -488,23 +906,36 @@ class TestSendRequest:
             mock_logger.debug.assert_called()
 
     async def test_debug_logging_no_body(self):
-        resp = _mock_response(content=_json_content({}))
+        resp = _mock_response(content=_EMPTY_JSON)
         self._patch_method('get', resp)
         with patch('xapiand.logger') as mock_logger:
             mock_logger.isEnabledFor.return_value = False
             await self.client._send_request('get', 'idx', id='doc')
             mock_logger.debug.assert_called()
 
-    async def test_debug_logging_body_not_json_serializable(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+    async def test_debug_logging_uses_serialized_body(self):
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method('post', resp)
-        with patch('xapiand.logger') as mock_logger:
-            mock_logger.isEnabledFor.return_value = True
-            # Pass body that will fail json.dumps in debug logging
-            body = {'key': object()}
-            with patch('xapiand.json.dumps', side_effect=[Exception("fail"), '{}']) as jd:
-                await self.client._send_request('post', 'idx', body=body)
-            mock_logger.debug.assert_called()
+        with patch('xapiand.logger') as mock_logger, \
+                patch('xapiand._json_dumps', wraps=_json_dumps) as jd:
+            await self.client._send_request('post', 'idx', body={'key': 'val'})
+        jd.assert_called_once()
+        args = mock_logger.debug.call_args_list[0].args
+        assert _load_json(args[2]) == {'key': 'val'}
+
+    async def test_body_not_json_serializable_raises(self):
+        resp = _mock_response(content=_OK_JSON)
+        method = self._patch_method('post', resp)
+        with pytest.raises(TypeError):
+            await self.client._send_request('post', 'idx', body={'key': object()})
+        method.assert_not_called()
+
+    async def test_error_response_not_printed(self, capsys):
+        resp = _mock_response(status_code=500, content=b'boom')
+        self._patch_method('get', resp)
+        with pytest.raises(httpx.HTTPStatusError):
+            await self.client._send_request('get', 'idx', id='doc1')
+        assert capsys.readouterr().out == ''
 
     async def test_search_aggregations_without_query(self):
         data = {
@@ -517,23 +948,23 @@ class TestSendRequest:
         # but results is empty so content is returned
         assert 'field' not in result or isinstance(result, DictObject)
 
+    async def test_search_aggregations_only_returned(self):
+        resp = _mock_response(content=_json_content({'#aggregations': {'field': {'count': 5}}, 'other': 1}))
+        self._patch_method('search', resp)
+        result = await self.client._send_request('search', 'idx')
+        assert result == {'aggregations': {'field': {'count': 5}}}
+        assert isinstance(result, DictObject)
+
 
 # ── Xapiand API methods ─────────────────────────────────────────────────────────────────────────────────────
 
 class TestXapiandSearch:
     """Tests for Xapiand.search parameter handling and delegation."""
 
-    def setup_method(self):
-        """Create a client and a default search response mock."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
-        self.resp = _mock_response(content=_json_content({
-            '#query': {
-                '#hits': [],
-                '#total_count': 0,
-                '#matches_estimated': 0,
-            },
-        }))
+    @pytest.fixture(autouse=True)
+    def _client(self, api_client):
+        """Use the module-wide client."""
+        self.client = api_client
 
     def _patch(self):
         """Patch _send_request to return an empty search result.
@@ -541,8 +972,8 @@ class TestXapiandSearch:
         Returns:
             A context manager that yields the patched mock.
         """
-        return patch.object(self.client, '_send_request',
-                            return_value=DictObject(hits=[], count=0, total=0))
+        return fast_patch(self.client, '_send_request',
+                          AsyncMock(return_value=DictObject(hits=[], count=0, total=0)))
 
     async def test_basic_search(self):
         with self._patch() as m:
@@ -568,23 +999,19 @@ class TestXapiandSearch:
             assert kwargs['params']['sort'] == 'field'
             assert kwargs['params']['language'] == 'en'
 
-    async def test_search_offset_too_high(self):
+    @pytest.mark.parametrize('offset, expected', [(200000, 0), ('invalid', 0), ('50', 50)])
+    async def test_search_offset_normalized(self, offset, expected):
         with self._patch() as m:
-            await self.client.search('idx', offset=200000)
+            await self.client.search('idx', offset=offset)
             kwargs = m.call_args.kwargs
-            assert kwargs['params']['offset'] == 0
+            assert kwargs['params']['offset'] == expected
 
-    async def test_search_offset_invalid_string(self):
-        with self._patch() as m:
+    async def test_search_offset_logged_lazily(self):
+        with self._patch(), patch('xapiand.logger') as mock_logger:
             await self.client.search('idx', offset='invalid')
-            kwargs = m.call_args.kwargs
-            assert kwargs['params']['offset'] == 0
-
-    async def test_search_offset_valid_string(self):
-        with self._patch() as m:
-            await self.client.search('idx', offset='50')
-            kwargs = m.call_args.kwargs
-            assert kwargs['params']['offset'] == 50
+        fmt, *args = mock_logger.debug.call_args.args
+        assert 'invalid' not in fmt
+        assert args == ['invalid', str]
 
     async def test_search_no_offset(self):
         with self._patch() as m:
@@ -608,20 +1035,20 @@ class TestXapiandSearch:
 class TestXapiandStats:
     """Tests for Xapiand.stats parameter forwarding."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, api_client):
+        """Use the module-wide client."""
+        self.client = api_client
 
     async def test_stats(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.stats('idx', pretty=True)
             args, kwargs = m.call_args
             assert args == ('stats', 'idx')
             assert kwargs['params']['pretty'] is True
 
     async def test_stats_kwargs(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.stats('idx', kwargs={'extra': 1})
             kwargs = m.call_args.kwargs
             assert kwargs['extra'] == 1
@@ -630,13 +1057,13 @@ class TestXapiandStats:
 class TestXapiandHead:
     """Tests for Xapiand.head parameter forwarding."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, api_client):
+        """Use the module-wide client."""
+        self.client = api_client
 
     async def test_head(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.head('idx', 'doc1', pretty=True)
             kwargs = m.call_args.kwargs
             assert kwargs['id'] == 'doc1'
@@ -646,31 +1073,31 @@ class TestXapiandHead:
 class TestXapiandCount:
     """Tests for Xapiand.count delegation and parameter handling."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, api_client):
+        """Use the module-wide client."""
+        self.client = api_client
 
     async def test_count_basic(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.count('idx')
             args = m.call_args
             assert args[0] == ('search', 'idx')
 
     async def test_count_with_query(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.count('idx', query='hello')
             kwargs = m.call_args.kwargs
             assert kwargs['params']['query'] == 'hello'
 
     async def test_count_with_body(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.count('idx', body={'match': 'all'})
             kwargs = m.call_args.kwargs
             assert kwargs['body'] == {'match': 'all'}
 
     async def test_count_extra_kw(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.count('idx', field='value')
             kwargs = m.call_args.kwargs
             assert kwargs['params']['field'] == 'value'
@@ -679,32 +1106,39 @@ class TestXapiandCount:
 class TestXapiandGet:
     """Tests for Xapiand.get retrieval, defaults, and headers."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, api_client):
+        """Use the module-wide client."""
+        self.client = api_client
 
     async def test_get(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject(title='hi')) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject(title='hi'))) as m:
             result = await self.client.get('idx', 'doc1')
             kwargs = m.call_args.kwargs
             assert kwargs['id'] == 'doc1'
             assert kwargs['default'] is NA
 
     async def test_get_with_default(self):
-        with patch.object(self.client, '_send_request', return_value=None) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=None)) as m:
             await self.client.get('idx', 'doc1', default=None)
             kwargs = m.call_args.kwargs
             assert kwargs['default'] is None
 
     async def test_get_with_accept(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.get('idx', 'doc1', accept='text/plain')
             kwargs = m.call_args.kwargs
             assert kwargs['headers']['accept'] == 'text/plain'
 
+    async def test_get_with_accept_keeps_caller_headers(self):
+        kwargs = {'headers': {'x-custom': 'val'}}
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
+            await self.client.get('idx', 'doc1', accept='text/plain', kwargs=kwargs)
+        assert m.call_args.kwargs['headers'] == {'x-custom': 'val', 'accept': 'text/plain'}
+        assert kwargs == {'headers': {'x-custom': 'val'}}
+
     async def test_get_volatile(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.get('idx', 'doc1', volatile=True)
             kwargs = m.call_args.kwargs
             assert kwargs['params']['volatile'] is True
@@ -713,21 +1147,20 @@ class TestXapiandGet:
 class TestXapiandDelete:
     """Tests for Xapiand.delete commit handling."""
 
-    def setup_method(self):
-        """Create a client with commit disabled."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
-        self.client.commit = False
+    @pytest.fixture(autouse=True)
+    def _client(self, api_client):
+        """Use the module-wide client."""
+        self.client = api_client
 
     async def test_delete(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.delete('idx', 'doc1')
             kwargs = m.call_args.kwargs
             assert kwargs['id'] == 'doc1'
             assert kwargs['params']['commit'] is False
 
     async def test_delete_with_commit(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.delete('idx', 'doc1', commit=True)
             kwargs = m.call_args.kwargs
             assert kwargs['params']['commit'] is True
@@ -736,21 +1169,20 @@ class TestXapiandDelete:
 class TestXapiandPost:
     """Tests for Xapiand.post body and commit handling."""
 
-    def setup_method(self):
-        """Create a client with commit disabled."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
-        self.client.commit = False
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
 
     async def test_post(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.post('idx', body={'title': 'doc'})
             kwargs = m.call_args.kwargs
             assert kwargs['body'] == {'title': 'doc'}
             assert kwargs['params']['commit'] is False
 
     async def test_post_with_commit(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.post('idx', body={'title': 'doc'}, commit=True)
             kwargs = m.call_args.kwargs
             assert kwargs['params']['commit'] is True
@@ -759,45 +1191,55 @@ class TestXapiandPost:
 class TestXapiandPut:
     """Tests for Xapiand.put body and id forwarding."""
 
-    def setup_method(self):
-        """Create a client with commit disabled."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
-        self.client.commit = False
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
 
     async def test_put(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.put('idx', body={'title': 'doc'}, id='doc1')
             kwargs = m.call_args.kwargs
             assert kwargs['id'] == 'doc1'
             assert kwargs['body'] == {'title': 'doc'}
 
+    async def test_put_with_content_type(self):
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
+            await self.client.put('idx', body=b'{"title":"doc"}', id='doc1', content_type='application/json')
+            kwargs = m.call_args.kwargs
+            assert kwargs['body'] == b'{"title":"doc"}'
+            assert kwargs['headers'] == {'content-type': 'application/json'}
+
 
 class TestXapiandIndex:
     """Tests that Xapiand.index delegates to put."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
 
     async def test_index_delegates_to_put(self):
-        with patch.object(self.client, 'put', return_value=DictObject()) as m:
+        with fast_patch(self.client, 'put', AsyncMock(return_value=DictObject())) as m:
             await self.client.index('idx', body={'a': 1}, id='doc1')
-            m.assert_called_once_with('idx', {'a': 1}, 'doc1', None, False, None)
+            m.assert_called_once_with('idx', {'a': 1}, 'doc1', None, False, None, None)
+
+    async def test_index_passes_content_type(self):
+        with fast_patch(self.client, 'put', AsyncMock(return_value=DictObject())) as m:
+            await self.client.index('idx', body=b'\x81\xa1a\x01', id='doc1', content_type='application/x-msgpack')
+            m.assert_called_once_with('idx', b'\x81\xa1a\x01', 'doc1', None, False, None, 'application/x-msgpack')
 
 
 class TestXapiandPatch:
     """Tests for Xapiand.patch partial update dispatching."""
 
-    def setup_method(self):
-        """Create a client with commit disabled."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
-        self.client.commit = False
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
 
     async def test_patch(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.patch('idx', 'doc1', body={'field': 'new'})
             args, kwargs = m.call_args
             assert args == ('patch', 'idx')
@@ -808,57 +1250,83 @@ class TestXapiandPatch:
 class TestXapiandUpdate:
     """Tests for Xapiand.update routing between put and merge."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
 
     async def test_update_with_content_type_uses_put(self):
-        with patch.object(self.client, 'put', return_value=DictObject()) as m:
+        with fast_patch(self.client, 'put', AsyncMock(return_value=DictObject())) as m:
             await self.client.update('idx', 'doc1', body={'a': 1},
                                content_type='application/json')
             m.assert_called_once()
 
     async def test_update_without_content_type_uses_merge(self):
-        with patch.object(self.client, 'merge', return_value=DictObject()) as m:
+        with fast_patch(self.client, 'merge', AsyncMock(return_value=DictObject())) as m:
             await self.client.update('idx', 'doc1', body={'a': 1})
             m.assert_called_once()
 
     async def test_update_passes_headers(self):
-        with patch.object(self.client, 'put', return_value=DictObject()) as m:
+        with fast_patch(self.client, 'put', AsyncMock(return_value=DictObject())) as m:
             await self.client.update('idx', 'doc1', body={'a': 1},
                                content_type='text/plain',
                                kwargs={'headers': {'x-custom': 'val'}})
-            call_kwargs = m.call_args
-            # kwargs dict should have headers with content-type
-            passed_kwargs = call_kwargs[0][5] or call_kwargs.kwargs.get('kwargs', {})
+            m.assert_called_once_with('idx', {'a': 1}, 'doc1', None, False,
+                                      {'headers': {'x-custom': 'val'}}, 'text/plain')
+
+    async def test_update_headers_reach_request(self):
+        kwargs = {'headers': {'x-custom': 'val'}}
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
+            await self.client.update('idx', 'doc1', body={'a': 1}, content_type='text/plain', kwargs=kwargs)
+        assert m.call_args.kwargs['headers'] == {'x-custom': 'val', 'content-type': 'text/plain'}
+        assert kwargs == {'headers': {'x-custom': 'val'}}
 
 
 class TestXapiandMerge:
     """Tests for Xapiand.merge deep-merge dispatching and headers."""
 
-    def setup_method(self):
-        """Create a client with commit disabled."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
-        self.client.commit = False
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
 
     async def test_merge(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.merge('idx', 'doc1', body={'field': 'val'})
             kwargs = m.call_args.kwargs
             assert kwargs['id'] == 'doc1'
             assert kwargs['body'] == {'field': 'val'}
 
     async def test_merge_with_content_type(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.merge('idx', 'doc1', body={'a': 1},
                               content_type='text/plain')
             kwargs = m.call_args.kwargs
             assert kwargs['headers']['content-type'] == 'text/plain'
 
+    async def test_merge_content_type_headers_shared(self):
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
+            await self.client.merge('idx', 'doc1', body={'a': 1}, content_type='text/plain')
+            await self.client.merge('idx', 'doc2', body={'a': 1}, content_type='text/plain')
+        first, second = m.call_args_list
+        assert first.kwargs['headers'] is second.kwargs['headers']
+        with pytest.raises(TypeError):
+            first.kwargs['headers']['content-type'] = 'text/html'
+
+    async def test_merge_does_not_mutate_kwargs(self):
+        kwargs = {'headers': {'x-custom': 'val'}, 'timeout': 5}
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
+            await self.client.merge('idx', 'doc1', body={'a': 1}, content_type='text/plain', kwargs=kwargs)
+            await self.client.merge('idx', 'doc2', body={'b': 2}, kwargs=kwargs)
+        assert kwargs == {'headers': {'x-custom': 'val'}, 'timeout': 5}
+        first, second = m.call_args_list
+        assert first.kwargs['headers'] == {'x-custom': 'val', 'content-type': 'text/plain'}
+        assert first.kwargs['timeout'] == 5
+        assert second.kwargs['id'] == 'doc2'
+        assert second.kwargs['headers'] == {'x-custom': 'val'}
+
     async def test_merge_without_content_type_no_header(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.merge('idx', 'doc1', body={'a': 1})
             kwargs = m.call_args.kwargs
             assert 'headers' not in kwargs
@@ -867,14 +1335,13 @@ class TestXapiandMerge:
 class TestXapiandStore:
     """Tests for Xapiand.store binary content handling."""
 
-    def setup_method(self):
-        """Create a client with commit disabled."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
-        self.client.commit = False
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
 
     async def test_store(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.store('idx', 'doc1', body=b'binary data')
             kwargs = m.call_args.kwargs
             assert kwargs['id'] == 'doc1'
@@ -882,12 +1349,181 @@ class TestXapiandStore:
             assert kwargs['params']['commit'] is False
 
     async def test_store_with_commit(self):
-        with patch.object(self.client, '_send_request', return_value=DictObject()) as m:
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
             await self.client.store('idx', 'doc1', body=b'data', commit=True)
             kwargs = m.call_args.kwargs
             assert kwargs['params']['commit'] is True
 
 
+class TestXapiandBulk:
+    """Tests for Xapiand.bulk concurrent execution."""
+
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
+
+    async def test_results_in_order(self):
+        async def fake_send(action_request, index, **kwargs):
+            """Echo the requested document id."""
+            return DictObject(id=kwargs['id'])
+
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=fake_send)):
+            results = await self.client.bulk([
+                ('get', {'index': 'idx', 'id': '1'}),
+                ('put', {'index': 'idx', 'id': '2', 'body': {'a': 1}}),
+            ])
+        assert [r.id for r in results] == ['1', '2']
+
+    async def test_unknown_method_raises(self):
+        with pytest.raises(ValueError, match='_send_request'):
+            await self.client.bulk([('_send_request', {})])
+
+    async def test_exception_propagates(self):
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=NotFoundError)):
+            with pytest.raises(NotFoundError):
+                await self.client.bulk([('get', {'index': 'idx', 'id': '1'})])
+
+    async def test_return_exceptions(self):
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=NotFoundError)):
+            results = await self.client.bulk([('get', {'index': 'idx', 'id': '1'})], return_exceptions=True)
+        assert isinstance(results[0], NotFoundError)
+
+    async def test_commit_deferred_to_last_write(self):
+        calls = []
+
+        async def fake_send(action_request, index, **kwargs):
+            """Record the id and commit flag of each call."""
+            calls.append((kwargs['id'], kwargs['params'].get('commit')))
+            return DictObject(id=kwargs['id'])
+
+        operations = [
+            ('put', {'index': 'idx', 'id': '1', 'body': {}, 'commit': True}),
+            ('merge', {'index': 'idx', 'id': '2', 'body': {}}),
+            ('get', {'index': 'idx', 'id': '3'}),
+        ]
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=fake_send)):
+            results = await self.client.bulk(operations, commit=True)
+        assert [r.id for r in results] == ['1', '2', '3']
+        assert calls[-1] == ('2', True)
+        assert sorted(calls[:-1]) == [('1', False), ('3', None)]
+        assert operations[0][1]['commit'] is True
+
+    async def test_commit_deferred_per_index(self):
+        calls = []
+
+        async def fake_send(action_request, index, **kwargs):
+            """Record the index, id, and commit flag of each call."""
+            calls.append((index, kwargs['id'], kwargs['params'].get('commit')))
+            return DictObject(id=kwargs['id'])
+
+        operations = [
+            ('index', {'index': 'a', 'id': '1', 'body': {}}),
+            ('index', {'index': 'b', 'id': '2', 'body': {}}),
+            ('index', {'index': 'a', 'id': '3', 'body': {}}),
+            ('index', {'index': 'a', 'id': '4', 'body': {}, 'kwargs': {'host': 'other'}}),
+        ]
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=fake_send)):
+            results = await self.client.bulk(operations, commit=True)
+        assert [r.id for r in results] == ['1', '2', '3', '4']
+        assert calls[0] == ('a', '1', False)
+        assert sorted(calls[1:]) == [('a', '3', True), ('a', '4', True), ('b', '2', True)]
+
+    async def test_commit_false_overrides_writes(self):
+        with fast_patch(self.client, '_send_request', AsyncMock(return_value=DictObject())) as m:
+            await self.client.bulk([('delete', {'index': 'idx', 'id': '1', 'commit': True})], commit=False)
+        assert m.call_args.kwargs['params']['commit'] is False
+
+    async def test_commit_deferred_write_exception_returned(self):
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=NotFoundError)):
+            results = await self.client.bulk([('delete', {'index': 'idx', 'id': '1'})],
+                                             return_exceptions=True, commit=True)
+        assert isinstance(results[0], NotFoundError)
+
+    async def test_concurrency_limit(self):
+        in_flight = peak = 0
+
+        async def fake_send(action_request, index, **kwargs):
+            """Track the peak number of concurrent calls."""
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return DictObject(id=kwargs['id'])
+
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=fake_send)):
+            results = await self.client.bulk(
+                [('get', {'index': 'idx', 'id': str(i)}) for i in range(10)], concurrency=3)
+        assert [r.id for r in results] == [str(i) for i in range(10)]
+        assert peak == 3
+
+
+class TestXapiandMergeMany:
+    """Tests for Xapiand.merge_many concurrent merges."""
+
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
+
+    async def test_merges_in_order(self):
+        async def fake_send(action_request, index, **kwargs):
+            """Echo the request arguments back as the result."""
+            return DictObject(action=action_request, index=index, id=kwargs['id'], body=kwargs['body'])
+
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=fake_send)):
+            results = await self.client.merge_many('idx', [('1', {'a': 1}), ('2', {'b': 2})])
+        assert [(r.action, r.index, r.id, r.body) for r in results] == [
+            ('merge', 'idx', '1', {'a': 1}),
+            ('merge', 'idx', '2', {'b': 2}),
+        ]
+
+    @pytest.mark.parametrize('ids, committed', [
+        (['missing', '1'], '1'),
+        (['1', 'missing'], 'missing'),
+    ])
+    async def test_failed_merge_with_commit(self, ids, committed):
+        calls = []
+
+        async def fake_send(action_request, index, **kwargs):
+            """Record the id and commit flag of each call, failing for ``missing``."""
+            calls.append((kwargs['id'], kwargs['params']['commit']))
+            if kwargs['id'] == 'missing':
+                raise NotFoundError
+            return DictObject()
+
+        with fast_patch(self.client, '_send_request', AsyncMock(side_effect=fake_send)):
+            results = await self.client.merge_many('idx', [(id, {}) for id in ids], commit=True,
+                                                   return_exceptions=True)
+        assert [isinstance(r, NotFoundError) for r in results] == [id == 'missing' for id in ids]
+        assert calls[-1] == (committed, True)
+        assert [commit for _, commit in calls[:-1]] == [False]
+
+    async def test_forwards_to_bulk(self):
+        with fast_patch(self.client, 'bulk', AsyncMock(return_value=[])) as m:
+            await self.client.merge_many('idx', {'1': {'a': 1}}.items(), concurrency=4, commit=True)
+        operations = list(m.call_args.args[0])
+        assert operations == [('merge', {'index': 'idx', 'id': '1', 'body': {'a': 1}})]
+        assert m.call_args.kwargs == {'return_exceptions': False, 'commit': True, 'concurrency': 4}
+
+
+class TestXapiandClose:
+    """Tests for Xapiand.aclose and the async context manager."""
+
+    async def test_aclose_closes_loop_session(self):
+        c = Xapiand()
+        session = c.session
+        await c.aclose()
+        assert session.is_closed
+        assert c.session is not session
+
+    async def test_context_manager_closes_session(self):
+        async with Xapiand() as c:
+            session = c.session
+        assert session.is_closed
+
+
 # ── Module-level singleton ───────────────────────────────────────────────────────────────────────────────────
 
 class TestModuleSingleton:
@@ -909,35 +1545,147 @@ class TestSerializeDefault:
     """Tests for _serialize_default custom JSON/msgpack serializer."""
 
     def test_decimal(self):
-        assert _serialize_default(Decimal('19.99')) == 19.99
+        assert _serialize_default(_DEC_19_99) == 19.99
 
     def test_decimal_integer(self):
         assert _serialize_default(Decimal('42')) == 42.0
 
     def test_datetime(self):
-        dt = datetime(2025, 6, 15, 12, 30, 45)
+        dt = _DT_20250615
         assert _serialize_default(dt) == '2025-06-15T12:30:45'
 
     def test_date(self):
-        d = date(2025, 6, 15)
+        d = _D_20250615
         assert _serialize_default(d) == '2025-06-15'
 
     def test_time(self):
-        t = time(12, 30, 45)
+        t = _T_123045
         assert _serialize_default(t) == '12:30:45'
 
+    def test_subclasses(self):
+        class MyDecimal(Decimal):
+            """Decimal subclass, missing the exact-type lookup."""
+
+        class MyDatetime(datetime):
+            """datetime subclass, missing the exact-type lookup."""
+
+        assert _serialize_default(MyDecimal('1.5')) == 1.5
+        assert _serialize_default(MyDatetime(2025, 6, 15, 12, 30, 45)) == '2025-06-15T12:30:45'
+
     def test_unsupported_type_raises(self):
         with pytest.raises(TypeError, match="not JSON/msgpack serializable"):
             _serialize_default(object())
 
 
+class TestContentKind:
+    """Tests for _content_kind content-type classification."""
+
+    @pytest.mark.parametrize('content_type, kind', [
+        ('application/json', _CT_JSON),
+        ('application/json; charset=utf-8', _CT_JSON),
+        ('application/x-msgpack', _CT_MSGPACK),
+        ('application/x-msgpack; charset=binary', _CT_MSGPACK),
+        ('text/plain', _CT_OTHER),
+        ('', _CT_OTHER),
+    ])
+    def test_classification(self, content_type, kind):
+        assert _content_kind(content_type) == kind
+
+    def test_classification_is_memoized(self):
+        _content_kind.cache_clear()
+        _content_kind('application/json')
+        _content_kind('application/json')
+        assert _content_kind.cache_info().hits == 1
+
+
+class TestNormalizeParams:
+    """Tests for _normalize_params query-string conversion."""
+
+    def test_double_underscore_to_dot(self):
+        assert _normalize_params({'a__b': 'x'}) == {'a.b': 'x'}
+
+    def test_bools_to_ints(self):
+        assert _normalize_params({'flag': True, 'other': False}) == {'flag': 1, 'other': 0}
+
+    def test_falsy_optional_flags_dropped(self):
+        params = {'commit': False, 'volatile': False, 'pretty': False, 'indent': 0, 'limit': 0}
+        assert _normalize_params(params) == {'limit': 0}
+
+    def test_truthy_optional_flags_kept(self):
+        assert _normalize_params({'commit': True, 'indent': 2}) == {'commit': 1, 'indent': 2}
+
+    def test_other_values_not_truth_tested(self):
+        class Ambiguous:
+            """Value whose truth cannot be tested, like an array."""
+
+            def __bool__(self):
+                raise ValueError('ambiguous')
+
+        value = Ambiguous()
+        assert _normalize_params({'query': value}) == {'query': value}
+
+
+class TestPrefixPath:
+    """Tests for _prefix_path schema path prefixing."""
+
+    @pytest.mark.parametrize('path', ['field', 'field/', '/field', 'pre/field', 'pre/field/'])
+    def test_normalized(self, path):
+        assert _prefix_path('pre/', path) == 'pre/field'
+
+    def test_no_prefix(self):
+        assert _prefix_path('', '/field/') == 'field'
+
+
+class TestJsonDumps:
+    """Tests for _json_dumps with and without the optional orjson backend."""
+
+    BODY = {
+        'price': _DEC_9_99,
+        'at': _DT_20250615,
+        'day': _D_20250615,
+        'time': _T_123045,
+        1: 'int key',
+        'text': 'caf\u00e9',
+    }
+
+    def test_stdlib_fallback(self):
+        with patch('xapiand.orjson', None):
+            encoded = _json_dumps(self.BODY)
+        assert isinstance(encoded, str)
+        assert encoded.isascii()
+        assert _load_json(encoded) == {
+            'price': 9.99, 'at': '2025-06-15T12:30:45', 'day': '2025-06-15',
+            'time': '12:30:45', '1': 'int key', 'text': 'caf\u00e9',
+        }
+
+    def test_orjson_matches_stdlib(self):
+        pytest.importorskip('orjson')
+        encoded = _json_dumps(self.BODY)
+        assert isinstance(encoded, bytes)
+        with patch('xapiand.orjson', None):
+            assert _load_json(encoded) == _load_json(_json_dumps(self.BODY))
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(TypeError):
+            _json_dumps({'key': object()})
+
+    def test_big_int_falls_back_to_stdlib(self):
+        pytest.importorskip('orjson')
+        assert _load_json(_json_dumps({'n': 2 ** 70})) == {'n': 2 ** 70}
+
+
 class TestSerializationInSendRequest:
     """Tests for Decimal and datetime serialization through _send_request."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
+
+    @pytest.fixture(autouse=True)
+    def _bind_patch_session(self, patch_session):
+        """Make the ``patch_session`` factory available to the tests."""
+        self._patch_session = patch_session
 
     def _patch_method(self, response):
         """Replace the client session with a mock that returns a canned response.
@@ -948,98 +1696,81 @@ class TestSerializationInSendRequest:
         Returns:
             The AsyncMock bound to ``session.request``.
         """
-        mock_session = MagicMock()
-        mock_session.request = AsyncMock(return_value=response)
-        self.client.session = mock_session
-        return mock_session.request
-
-    def teardown_method(self):
-        """Remove the per-instance session mock so the class attribute is restored."""
-        self.client.__dict__.pop('session', None)
+        return self._patch_session(self.client, response)
 
     async def test_body_with_decimal_json(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method(resp)
-        await self.client._send_request('post', 'idx', body={'price': Decimal('19.99')})
-        body_sent = json.loads(method.call_args.kwargs['content'])
+        await self.client._send_request('post', 'idx', body={'price': _DEC_19_99})
+        body_sent = _load_json(method.call_args.kwargs['content'])
         assert body_sent['price'] == 19.99
 
     async def test_body_with_datetime_json(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method(resp)
-        dt = datetime(2025, 6, 15, 12, 30, 45)
+        dt = _DT_20250615
         await self.client._send_request('post', 'idx', body={'timestamp': dt})
-        body_sent = json.loads(method.call_args.kwargs['content'])
+        body_sent = _load_json(method.call_args.kwargs['content'])
         assert body_sent['timestamp'] == '2025-06-15T12:30:45'
 
     async def test_body_with_date_json(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method(resp)
-        d = date(2025, 6, 15)
+        d = _D_20250615
         await self.client._send_request('post', 'idx', body={'day': d})
-        body_sent = json.loads(method.call_args.kwargs['content'])
+        body_sent = _load_json(method.call_args.kwargs['content'])
         assert body_sent['day'] == '2025-06-15'
 
     async def test_body_with_time_json(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method(resp)
-        t = time(12, 30, 45)
+        t = _T_123045
         await self.client._send_request('post', 'idx', body={'at': t})
-        body_sent = json.loads(method.call_args.kwargs['content'])
+        body_sent = _load_json(method.call_args.kwargs['content'])
         assert body_sent['at'] == '12:30:45'
 
     async def test_nested_body_with_mixed_types_json(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method(resp)
         body = {
             'data': {
                 'timestamp': datetime(2025, 1, 1, 0, 0, 0),
-                'price': Decimal('9.99'),
+                'price': _DEC_9_99,
                 'date': date(2025, 1, 1),
             },
             'tags': ['a', 'b'],
         }
         await self.client._send_request('post', 'idx', body=body)
-        body_sent = json.loads(method.call_args.kwargs['content'])
-        assert body_sent['data']['timestamp'] == '2025-01-01T00:00:00'
-        assert body_sent['data']['price'] == 9.99
-        assert body_sent['data']['date'] == '2025-01-01'
-        assert body_sent['tags'] == ['a', 'b']
-
-    async def test_body_with_decimal_msgpack(self):
-        mock_msgpack = MagicMock()
-        mock_msgpack.dumps.return_value = b'\x80'
-        resp = _mock_response(content=_json_content({"ok": True}))
+        body_sent = _load_json(method.call_args.kwargs['content'])
+        assert body_sent == {
+            'data': {'timestamp': '2025-01-01T00:00:00', 'price': 9.99, 'date': '2025-01-01'},
+            'tags': ['a', 'b'],
+        }
+
+    async def test_body_with_decimal_msgpack(self, mock_msgpack):
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method(resp)
-        c = Xapiand(host='localhost', port=8880, prefix=None,
-                     default_accept='application/x-msgpack')
-        c.session = self.client.session
-        body = {'price': Decimal('19.99')}
-        with patch('xapiand.msgpack', mock_msgpack):
-            await c._send_request('post', 'idx', body=body)
-        mock_msgpack.dumps.assert_called_once()
-        call_kwargs = mock_msgpack.dumps.call_args
+        self.client.default_accept = 'application/x-msgpack'
+        body = {'price': _DEC_19_99}
+        await self.client._send_request('post', 'idx', body=body)
+        mock_msgpack.Packer.return_value.pack.assert_called_once()
+        call_kwargs = mock_msgpack.Packer.call_args
         assert call_kwargs.kwargs['default'] is _serialize_default
 
     async def test_data_kwarg_with_decimal_json(self):
-        resp = _mock_response(content=_json_content({"ok": True}))
+        resp = _mock_response(content=_OK_JSON)
         method = self._patch_method(resp)
-        await self.client._send_request('post', 'idx', data={'price': Decimal('5.50')})
-        body_sent = json.loads(method.call_args.kwargs['content'])
+        await self.client._send_request('post', 'idx', data={'price': _DEC_5_50})
+        body_sent = _load_json(method.call_args.kwargs['content'])
         assert body_sent['price'] == 5.5
 
-    async def test_data_kwarg_with_decimal_msgpack(self):
-        mock_msgpack = MagicMock()
-        mock_msgpack.dumps.return_value = b'\x80'
-        resp = _mock_response(content=_json_content({"ok": True}))
+    async def test_data_kwarg_with_decimal_msgpack(self, mock_msgpack):
+        resp = _mock_response(content=_OK_JSON)
         self._patch_method(resp)
-        c = Xapiand(host='localhost', port=8880, prefix=None,
-                     default_accept='application/x-msgpack')
-        c.session = self.client.session
-        with patch('xapiand.msgpack', mock_msgpack):
-            await c._send_request('post', 'idx', data={'price': Decimal('5.50')})
-        mock_msgpack.dumps.assert_called_once()
-        call_kwargs = mock_msgpack.dumps.call_args
+        self.client.default_accept = 'application/x-msgpack'
+        await self.client._send_request('post', 'idx', data={'price': _DEC_5_50})
+        mock_msgpack.Packer.return_value.pack.assert_called_once()
+        call_kwargs = mock_msgpack.Packer.call_args
         assert call_kwargs.kwargs['default'] is _serialize_default
 
 
@@ -1050,28 +1781,46 @@ class TestModuleImportPaths:
 
     def test_httpx_import_error(self):
         """Verify ImportError is raised when httpx is not available."""
+        import subprocess
         import sys
-        import importlib
-        # Temporarily remove httpx from sys.modules
-        saved = sys.modules.pop('httpx', None)
-        saved_xapiand = sys.modules.pop('xapiand', None)
-        saved_xapiand_coll = sys.modules.pop('xapiand.collections', None)
-        try:
-            # Block httpx import
-            sys.modules['httpx'] = None
-            with pytest.raises(ImportError, match="Xapiand requires"):
-                importlib.import_module('xapiand')
-        finally:
-            # Restore
-            sys.modules.pop('httpx', None)
-            sys.modules.pop('xapiand', None)
-            sys.modules.pop('xapiand.collections', None)
-            if saved is not None:
-                sys.modules['httpx'] = saved
-            if saved_xapiand is not None:
-                sys.modules['xapiand'] = saved_xapiand
-            if saved_xapiand_coll is not None:
-                sys.modules['xapiand.collections'] = saved_xapiand_coll
+        result = subprocess.run(
+            [sys.executable, '-c', "import sys; sys.modules['httpx'] = None; import xapiand"],
+            capture_output=True, text=True,
+        )
+        assert result.returncode != 0
+        assert 'ImportError: Xapiand requires' in result.stderr
+
+    @pytest.mark.parametrize('stubs, expected', [
+        ("'zstandard', 'brotli'", 'zstd, br, deflate, gzip, identity'),
+        ("'brotlicffi',", 'br, deflate, gzip, identity'),
+    ])
+    def test_optional_decoders_advertised(self, stubs, expected):
+        """Verify zstd/brotli are added in front of the default encodings when importable."""
+        import subprocess
+        import sys
+        code = (
+            f"import sys, types\n"
+            f"for name in ({stubs}): sys.modules[name] = types.ModuleType(name)\n"
+            f"sys.modules.setdefault('zstandard', None); sys.modules.setdefault('brotli', None)\n"
+            f"import xapiand; print(xapiand.DEFAULT_ACCEPT_ENCODING)"
+        )
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        assert out.strip() == expected
+
+    @pytest.mark.parametrize('commit, expected', [
+        ('1', True), ('Yes', True), ('false', False),
+    ])
+    def test_env_settings_parsed(self, commit, expected):
+        """Verify port and commit environment variables are typed at import."""
+        import os
+        import subprocess
+        import sys
+        env = {**os.environ, 'XAPIAND_PORT': '9999', 'XAPIAND_COMMIT': commit}
+        out = subprocess.run(
+            [sys.executable, '-c', 'import xapiand; print(repr(xapiand.XAPIAND_PORT), xapiand.XAPIAND_COMMIT)'],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        assert out == ['9999', str(expected)]
 
 
 # ── _deserialize_value ───────────────────────────────────────────────────────────────────────────────────────
@@ -1091,7 +1840,7 @@ class TestDeserializeValue:
 
     def test_datetime_string(self):
         result = _deserialize_value('2025-06-15T12:30:45')
-        assert result == datetime(2025, 6, 15, 12, 30, 45)
+        assert result == _DT_20250615
         assert isinstance(result, datetime)
 
     def test_datetime_with_microseconds(self):
@@ -1108,17 +1857,17 @@ class TestDeserializeValue:
 
     def test_datetime_with_space_separator(self):
         result = _deserialize_value('2025-06-15 12:30:45')
-        assert result == datetime(2025, 6, 15, 12, 30, 45)
+        assert result == _DT_20250615
 
     def test_date_string(self):
         result = _deserialize_value('2025-06-15')
-        assert result == date(2025, 6, 15)
+        assert result == _D_20250615
         assert isinstance(result, date)
         assert not isinstance(result, datetime)
 
     def test_time_string(self):
         result = _deserialize_value('12:30:45')
-        assert result == time(12, 30, 45)
+        assert result == _T_123045
         assert isinstance(result, time)
 
     def test_time_with_microseconds(self):
@@ -1174,8 +1923,8 @@ class TestDeserializeObjectPairsHook:
     def test_deserializes_values(self):
         pairs = [('price', 9.99), ('date', '2025-06-15')]
         result = _deserialize_object_pairs_hook(pairs)
-        assert result['price'] == Decimal('9.99')
-        assert result['date'] == date(2025, 6, 15)
+        assert result['price'] == _DEC_9_99
+        assert result['date'] == _D_20250615
 
 
 # ── Deserialization in _send_request ─────────────────────────────────────────────────────────────────────────
@@ -1183,10 +1932,15 @@ class TestDeserializeObjectPairsHook:
 class TestDeserializationInSendRequest:
     """Tests for Decimal and datetime deserialization through _send_request."""
 
-    def setup_method(self):
-        """Create a client with JSON accept and no prefix."""
-        self.client = Xapiand(host='localhost', port=8880, prefix=None,
-                              default_accept='application/json')
+    @pytest.fixture(autouse=True)
+    def _client(self, client):
+        """Use a fresh copy of the module-wide client."""
+        self.client = client
+
+    @pytest.fixture(autouse=True)
+    def _bind_patch_session(self, patch_session):
+        """Make the ``patch_session`` factory available to the tests."""
+        self._patch_session = patch_session
 
     def _patch_method(self, response):
         """Replace the client session with a mock that returns a canned response.
@@ -1197,39 +1951,32 @@ class TestDeserializationInSendRequest:
         Returns:
             The AsyncMock bound to ``session.request``.
         """
-        mock_session = MagicMock()
-        mock_session.request = AsyncMock(return_value=response)
-        self.client.session = mock_session
-        return mock_session.request
-
-    def teardown_method(self):
-        """Remove the per-instance session mock so the class attribute is restored."""
-        self.client.__dict__.pop('session', None)
+        return self._patch_session(self.client, response)
 
     async def test_json_float_to_decimal(self):
         resp = _mock_response(content=b'{"price": 19.99}')
         self._patch_method(resp)
         result = await self.client._send_request('get', 'idx', id='doc1')
-        assert result['price'] == Decimal('19.99')
+        assert result['price'] == _DEC_19_99
         assert isinstance(result['price'], Decimal)
 
     async def test_json_datetime_string(self):
         resp = _mock_response(content=_json_content({"timestamp": "2025-06-15T12:30:45"}))
         self._patch_method(resp)
         result = await self.client._send_request('get', 'idx', id='doc1')
-        assert result['timestamp'] == datetime(2025, 6, 15, 12, 30, 45)
+        assert result['timestamp'] == _DT_20250615
 
     async def test_json_date_string(self):
         resp = _mock_response(content=_json_content({"day": "2025-06-15"}))
         self._patch_method(resp)
         result = await self.client._send_request('get', 'idx', id='doc1')
-        assert result['day'] == date(2025, 6, 15)
+        assert result['day'] == _D_20250615
 
     async def test_json_time_string(self):
         resp = _mock_response(content=_json_content({"at": "12:30:45"}))
         self._patch_method(resp)
         result = await self.client._send_request('get', 'idx', id='doc1')
-        assert result['at'] == time(12, 30, 45)
+        assert result['at'] == _T_123045
 
     async def test_json_nested_mixed_types(self):
         data = {
@@ -1240,14 +1987,17 @@ class TestDeserializationInSendRequest:
             },
             "count": 42,
         }
-        resp = _mock_response(content=json.dumps(data).encode())
+        resp = _mock_response(content=_json_content(data))
         self._patch_method(resp)
         result = await self.client._send_request('get', 'idx', id='doc1')
-        assert isinstance(result['product']['price'], Decimal)
-        assert result['product']['price'] == Decimal('9.99')
-        assert result['product']['created'] == datetime(2025, 1, 1, 0, 0, 0)
-        assert result['product']['tags'] == ['sale', 'new']
-        assert result['count'] == 42
+        assert result == {
+            'product': {
+                'price': _DEC_9_99,
+                'created': datetime(2025, 1, 1, 0, 0, 0),
+                'tags': ['sale', 'new'],
+            },
+            'count': 42,
+        }
 
     async def test_json_list_with_floats(self):
         resp = _mock_response(content=b'{"values": [1.1, 2.2, 3.3]}')
@@ -1256,15 +2006,13 @@ class TestDeserializationInSendRequest:
         assert all(isinstance(v, Decimal) for v in result['values'])
         assert result['values'] == [Decimal('1.1'), Decimal('2.2'), Decimal('3.3')]
 
-    async def test_msgpack_float_to_decimal(self):
-        mock_msgpack = MagicMock()
-        mock_msgpack.loads.return_value = DictObject(price=Decimal('19.99'))
+    async def test_msgpack_float_to_decimal(self, mock_msgpack):
+        mock_msgpack.loads.return_value = DictObject(price=_DEC_19_99)
         resp = _mock_response(content=b'\x80', content_type='application/x-msgpack')
         self._patch_method(resp)
-        with patch('xapiand.msgpack', mock_msgpack):
-            result = await self.client._send_request('get', 'idx', id='doc1')
+        result = await self.client._send_request('get', 'idx', id='doc1')
         mock_msgpack.loads.assert_called_once_with(b'\x80', object_pairs_hook=_deserialize_object_pairs_hook)
-        assert result['price'] == Decimal('19.99')
+        assert result['price'] == _DEC_19_99
 
     async def test_json_non_matching_string_unchanged(self):
         resp = _mock_response(content=_json_content({"name": "hello world"}))
@@ -1,6 +1,11 @@
 """Tests for xapiand.collections — DictObject and OrderedDictObject."""
 from __future__ import annotations
 
+import copy
+import pickle
+
+import pytest
+
 from xapiand.collections import DictObject, OrderedDictObject
 
 
@@ -47,9 +52,31 @@ class TestDictObject:
         del obj.a
         assert "a" not in obj
 
-    def test_dict_identity(self):
+    def test_no_instance_dict(self):
         obj = DictObject(a=1)
-        assert obj.__dict__ is obj
+        assert not hasattr(obj, "__dict__")
+
+    def test_missing_attr_raises(self):
+        obj = DictObject()
+        with pytest.raises(AttributeError):
+            obj.missing
+        assert getattr(obj, "missing", None) is None
+
+    def test_delete_missing_raises(self):
+        with pytest.raises(AttributeError):
+            del DictObject().missing
+
+    def test_dict_methods_not_shadowed(self):
+        obj = DictObject(keys="value", items=1)
+        assert list(obj.keys()) == ["keys", "items"]
+        assert obj["keys"] == "value"
+
+    def test_copy_and_pickle(self):
+        obj = DictObject(a=1, nested=DictObject(b=2))
+        for clone in (copy.copy(obj), copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+            assert type(clone) is DictObject
+            assert clone == obj
+            assert clone.nested.b == 2
 
 
 # ── OrderedDictObject ───────────────────────────────────────────────────────────────────────────────────────
@@ -89,11 +116,8 @@ class TestOrderedDictObject:
 
     def test_delete_missing_raises(self):
         obj = OrderedDictObject()
-        try:
+        with pytest.raises(AttributeError):
             del obj.nonexistent
-            assert False, "Should have raised"
-        except KeyError:
-            pass
 
     def test_preserves_order(self):
         obj = OrderedDictObject()
@@ -102,9 +126,18 @@ class TestOrderedDictObject:
         obj["m"] = 3
         assert list(obj.keys()) == ["z", "a", "m"]
 
-    def test_dict_is_self(self):
+    def test_missing_attr_raises(self):
+        with pytest.raises(AttributeError):
+            OrderedDictObject().missing
+
+    def test_dict_methods_not_shadowed(self):
+        obj = OrderedDictObject([("keys", 1)])
+        assert list(obj.keys()) == ["keys"]
+
+    def test_instance_of_class(self):
         obj = OrderedDictObject([("a", 1)])
-        assert obj.__dict__ is obj
+        assert type(obj) is OrderedDictObject
+        assert type(OrderedDictObject()) is type(obj)
 
     def test_init_kwargs(self):
         obj = OrderedDictObject(x=10, y=20)
@@ -4,11 +4,14 @@ from __future__ import annotations
 import pytest
 
 from xapiand.utils import (
+    SerialiseReader,
+    SerialiseWriter,
     serialise_char,
     serialise_length,
     serialise_string,
     unserialise_char,
     unserialise_length,
+    unserialise_length_at,
     unserialise_string,
 )
 
@@ -19,69 +22,123 @@ class TestSerialiseLength:
     """Tests for serialise_length encoding of integer values."""
 
     def test_zero(self):
-        assert serialise_length(0) == chr(0)
+        assert serialise_length(0) == b"\x00"
 
     def test_small_value(self):
-        assert serialise_length(42) == chr(42)
+        assert serialise_length(42) == b"*"
 
     def test_boundary_254(self):
-        assert serialise_length(254) == chr(254)
+        assert serialise_length(254) == b"\xfe"
 
     def test_boundary_255(self):
         encoded = serialise_length(255)
-        assert encoded[0] == chr(0xff)
+        assert encoded[0] == 0xff
 
     def test_large_value(self):
         encoded = serialise_length(1000)
-        assert encoded[0] == chr(0xff)
+        assert encoded[0] == 0xff
         assert len(encoded) > 1
 
+    def test_single_byte_shared(self):
+        assert serialise_length(42) is serialise_length(42)
+
+    def test_negative_raises(self):
+        with pytest.raises(ValueError):
+            serialise_length(-1)
+
+    def test_returns_bytes(self):
+        assert type(serialise_length(42)) is bytes
+        assert type(serialise_length(1000)) is bytes
+
+    @pytest.mark.parametrize("value, expected", [
+        (255, b"\xff\x80"),
+        (300, b"\xff\xad"),
+        (255 + 0x80, b"\xff\x00\x81"),
+        (255 + 0x3fff, b"\xff\x7f\xff"),
+        (255 + 0x4000, b"\xff\x00\x00\x81"),
+    ])
+    def test_wire_format(self, value, expected):
+        assert serialise_length(value) == expected
+
 
 class TestUnserialiseLength:
     """Tests for unserialise_length decoding and error handling."""
 
     def test_empty_data_raises(self):
         with pytest.raises(ValueError, match="no data"):
-            unserialise_length("")
+            unserialise_length(b"")
 
     def test_small_value(self):
-        length, remaining = unserialise_length(chr(42) + "extra")
+        length, remaining = unserialise_length(b"*" + b"extra")
         assert length == 42
-        assert remaining == "extra"
+        assert remaining == b"extra"
 
     def test_insufficient_data_raises(self):
         # 0xff followed by no continuation bytes
         with pytest.raises(ValueError, match="insufficient data"):
-            unserialise_length(chr(0xff))
+            unserialise_length(b"\xff")
 
     def test_check_remaining_raises(self):
         # Encode length 10 but provide only 2 chars of remaining data
         encoded = serialise_length(10)
         with pytest.raises(ValueError, match="length greater than data"):
-            unserialise_length(encoded + "ab", check_remaining=True)
+            unserialise_length(encoded + b"ab", check_remaining=True)
 
     def test_check_remaining_ok(self):
         encoded = serialise_length(3)
-        length, remaining = unserialise_length(encoded + "abc", check_remaining=True)
+        length, remaining = unserialise_length(encoded + b"abc", check_remaining=True)
         assert length == 3
-        assert remaining == "abc"
+        assert remaining == b"abc"
+
+
+class TestUnserialiseLengthAt:
+    """Tests for unserialise_length_at offset-based decoding."""
+
+    def test_small_value(self):
+        assert unserialise_length_at(b"xx*rest", 2) == (42, 3)
+
+    def test_large_value(self):
+        data = b"\x03abc" + serialise_length(300)
+        assert unserialise_length_at(data, 4) == (300, 6)
+
+    def test_walks_fields(self):
+        data = serialise_string(b"ab") + serialise_string(b"x" * 300)
+        offset = 0
+        fields = []
+        while offset < len(data):
+            length, offset = unserialise_length_at(data, offset, True)
+            fields.append(data[offset:offset + length])
+            offset += length
+        assert fields == [b"ab", b"x" * 300]
+
+    def test_no_data_raises(self):
+        with pytest.raises(ValueError, match="no data"):
+            unserialise_length_at(b"abc", 3)
+
+    def test_insufficient_data_raises(self):
+        with pytest.raises(ValueError, match="insufficient data"):
+            unserialise_length_at(b"a\xff\x00", 1)
+
+    def test_check_remaining_raises(self):
+        with pytest.raises(ValueError, match="length greater than data"):
+            unserialise_length_at(b"a\x05abc", 1, check_remaining=True)
 
 
 class TestRoundtripLength:
     """Tests for serialise_length/unserialise_length roundtrip consistency."""
 
-    @pytest.mark.parametrize("value", [0, 1, 127, 254, 255, 256, 500, 1000, 16383, 16384, 100000])
+    @pytest.mark.parametrize("value", [0, 1, 127, 254, 255, 256, 382, 383, 500, 1000, 16383, 16384, 16638, 16639, 100000, 2 ** 40])
     def test_roundtrip(self, value):
         encoded = serialise_length(value)
         decoded, remaining = unserialise_length(encoded)
         assert decoded == value
-        assert remaining == ""
+        assert remaining == b""
 
     def test_roundtrip_with_trailing_data(self):
-        encoded = serialise_length(300) + "tail"
+        encoded = serialise_length(300) + b"tail"
         decoded, remaining = unserialise_length(encoded)
         assert decoded == 300
-        assert remaining == "tail"
+        assert remaining == b"tail"
 
 
 # ── serialise_string / unserialise_string ────────────────────────────────────────────────────────────────────
@@ -90,41 +147,67 @@ class TestSerialiseString:
     """Tests for serialise_string length-prefixed encoding."""
 
     def test_empty_string(self):
-        result = serialise_string("")
-        assert result == chr(0)
+        result = serialise_string(b"")
+        assert result == b"\x00"
 
     def test_short_string(self):
-        result = serialise_string("hello")
+        result = serialise_string(b"hello")
         length, remaining = unserialise_length(result)
         assert length == 5
-        assert remaining == "hello"
+        assert remaining == b"hello"
+
+
+    def test_str_encoded_as_utf8(self):
+        result = serialise_string("año")
+        assert result == b"\x04a\xc3\xb1o"
+        decoded, remaining = unserialise_string(result)
+        assert bytes(decoded).decode("utf-8") == "año"
+
+    def test_bytes_like(self):
+        assert serialise_string(bytearray(b"ab")) == b"\x02ab"
+        assert serialise_string(memoryview(b"ab")) == b"\x02ab"
 
 
 class TestUnserialiseString:
     """Tests for unserialise_string decoding and error handling."""
 
     def test_roundtrip(self):
-        original = "hello world"
+        original = b"hello world"
         encoded = serialise_string(original)
         decoded, remaining = unserialise_string(encoded)
         assert decoded == original
-        assert remaining == ""
+        assert remaining == b""
 
     def test_roundtrip_with_trailing(self):
-        encoded = serialise_string("abc") + "XYZ"
+        encoded = serialise_string(b"abc") + b"XYZ"
         decoded, remaining = unserialise_string(encoded)
-        assert decoded == "abc"
-        assert remaining == "XYZ"
+        assert decoded == b"abc"
+        assert remaining == b"XYZ"
 
     def test_empty_string_roundtrip(self):
-        encoded = serialise_string("")
+        encoded = serialise_string(b"")
         decoded, remaining = unserialise_string(encoded)
-        assert decoded == ""
-        assert remaining == ""
+        assert decoded == b""
+        assert remaining == b""
+
+    def test_returns_memoryviews(self):
+        data = serialise_string(b"abc") + b"XYZ"
+        decoded, remaining = unserialise_string(data)
+        assert isinstance(decoded, memoryview)
+        assert isinstance(remaining, memoryview)
+        assert decoded.obj is data
+        assert decoded.tobytes() == b"abc"
+
+    def test_chained_views(self):
+        data = serialise_string(b"first") + serialise_string(b"second")
+        first, remaining = unserialise_string(data)
+        second, remaining = unserialise_string(remaining)
+        assert (first, second, remaining) == (b"first", b"second", b"")
+        assert second.obj is data
 
     def test_insufficient_data_raises(self):
         # Encode length 10 but only provide 2 chars
-        encoded = serialise_length(10) + "ab"
+        encoded = serialise_length(10) + b"ab"
         with pytest.raises(ValueError, match="length greater than data"):
             unserialise_string(encoded)
 
@@ -135,30 +218,97 @@ class TestSerialiseChar:
     """Tests for serialise_char single-character encoding."""
 
     def test_single_char(self):
-        assert serialise_char("A") == "A"
+        assert serialise_char(b"A") == b"A"
+
+    def test_str_char(self):
+        assert serialise_char("A") == b"A"
+
+    def test_non_ascii_str_raises(self):
+        with pytest.raises(ValueError, match="Cannot serialise empty char"):
+            serialise_char("ñ")
 
     def test_empty_raises(self):
         with pytest.raises(ValueError, match="Cannot serialise empty char"):
-            serialise_char("")
+            serialise_char(b"")
 
     def test_multi_char_raises(self):
         with pytest.raises(ValueError, match="Cannot serialise empty char"):
-            serialise_char("AB")
+            serialise_char(b"AB")
 
 
 class TestUnserialiseChar:
     """Tests for unserialise_char decoding and error handling."""
 
     def test_single_char(self):
-        char, remaining = unserialise_char("Ahello")
-        assert char == "A"
-        assert remaining == "hello"
+        char, remaining = unserialise_char(b"Ahello")
+        assert char == b"A"
+        assert remaining == b"hello"
 
     def test_exactly_one_char(self):
-        char, remaining = unserialise_char("X")
-        assert char == "X"
-        assert remaining == ""
+        char, remaining = unserialise_char(b"X")
+        assert char == b"X"
+        assert remaining == b""
 
     def test_empty_raises(self):
         with pytest.raises(ValueError, match="insufficient data"):
-            unserialise_char("")
+            unserialise_char(b"")
+
+
+# ── SerialiseWriter / SerialiseReader ────────────────────────────────────────────────────────────────────────
+
+class TestSerialiseWriter:
+    """Tests for SerialiseWriter in-place message building."""
+
+    def test_matches_function_output(self):
+        writer = SerialiseWriter()
+        writer.write_length(300)
+        writer.write_string(b"abc")
+        writer.write_string("año")
+        writer.write_char("X")
+        expected = serialise_length(300) + serialise_string(b"abc") + serialise_string("año") + b"X"
+        assert writer.getvalue() == expected
+
+    def test_empty(self):
+        assert SerialiseWriter().getvalue() == b""
+
+    def test_write_char_raises(self):
+        with pytest.raises(ValueError, match="Cannot serialise empty char"):
+            SerialiseWriter().write_char(b"AB")
+
+
+class TestSerialiseReader:
+    """Tests for SerialiseReader cursor-based decoding."""
+
+    def test_roundtrip(self):
+        writer = SerialiseWriter()
+        writer.write_string(b"key")
+        writer.write_length(100000)
+        writer.write_string(b"x" * 300)
+        writer.write_char(b"Z")
+        data = writer.getvalue()
+        reader = SerialiseReader(data)
+        assert reader.read_string() == b"key"
+        assert reader.read_length() == 100000
+        value = reader.read_string()
+        assert value == b"x" * 300
+        assert value.obj is data
+        assert reader.read_char() == b"Z"
+        assert reader.remaining() == b""
+
+    def test_remaining(self):
+        reader = SerialiseReader(serialise_string(b"ab") + b"tail")
+        reader.read_string()
+        assert reader.remaining() == b"tail"
+
+    def test_read_string_insufficient_raises(self):
+        reader = SerialiseReader(serialise_length(10) + b"ab")
+        with pytest.raises(ValueError, match="length greater than data"):
+            reader.read_string()
+
+    def test_read_length_exhausted_raises(self):
+        with pytest.raises(ValueError, match="no data"):
+            SerialiseReader(b"").read_length()
+
+    def test_read_char_exhausted_raises(self):
+        with pytest.raises(ValueError, match="insufficient data"):
+            SerialiseReader(b"").read_char()